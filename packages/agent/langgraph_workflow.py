@@ -6,31 +6,37 @@ Orchestrates multiple specialized agents for comprehensive property analysis.
 Uses LangGraph for state management and agent coordination.
 
 Architecture:
-    Orchestrator → [Zoning Agent, Valuation Agent, Permit Agent, Visualization Agent]
-                 → Synthesizer → Final Report
+    Phase 1 → [Zoning Agent ∥ Permit Agent]
+    Phase 2 → [Valuation Agent ∥ Visualization Agent]  (uses zoning results)
+            → Synthesizer → Final Report
 
 Usage:
-    from langgraph_workflow import create_analysis_workflow, run_property_analysis
+    from langgraph_workflow import analysis_workflow, run_property_analysis
     
-    workflow = create_analysis_workflow()
-    result = await run_property_analysis(workflow, parcel_id="2512345")
+    async with analysis_workflow() as workflow:
+        result = await run_property_analysis(workflow, parcel_id="2512345")
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
+import operator
+import os
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Annotated, Any, Literal, TypedDict
+from typing import TYPE_CHECKING, Annotated, Any, TypedDict
 from datetime import datetime
 
-from langgraph.graph import StateGraph, END
-from langgraph.graph.message import add_messages
-from langgraph.checkpoint.memory import MemorySaver
+from async_lru import alru_cache
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
-# Import our skill-based agents
-from zonewise_agent import create_agent, AgentDependencies
+# LangGraph and the skill-based agents (which pull in the model clients) are
+# imported where they are first used, so importing this module stays cheap.
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
 
 # ============================================================================
 # State Models
@@ -38,12 +44,16 @@ from zonewise_agent import create_agent, AgentDependencies
 
 class PropertyData(BaseModel):
     """Collected property data from all agents"""
+    # Agents build instances via model_construct; assignments stay unvalidated
+    model_config = ConfigDict(validate_assignment=False)
+    
     parcel_id: str
     address: str | None = None
     
     # Zoning data
     zoning_district: str | None = None
     zoning_dims: dict[str, Any] | None = None
+    lot_area_sqft: float | None = None
     permitted_uses: list[str] = []
     
     # Valuation data
@@ -66,22 +76,217 @@ class PropertyData(BaseModel):
     avg_sun_hours: float | None = None
     shadow_impact: str | None = None
 
+class FullAnalysis(BaseModel):
+    """Structured output for the combined single-call analysis"""
+    zoning_district: str | None = None
+    zoning_dims: dict[str, Any] | None = None
+    lot_area_sqft: float | None = None
+    arv: float | None = None
+    max_bid: float | None = None
+    permit_history: list[dict] = []
+    open_violations: list[dict] = []
+    permit_risk_score: int = 0
+    max_buildable_sqft: float | None = None
+    avg_sun_hours: float | None = None
+
+def merge_property_data(left: PropertyData, right: PropertyData) -> PropertyData:
+    """Reducer: merge the fields each parallel agent set into one PropertyData
+    
+    Relies on fields_set, which model_construct records from its keyword args.
+    """
+    return left.model_copy(update=right.model_dump(exclude_unset=True))
+
+def merge_completed(left: list[str], right: list[str]) -> list[str]:
+    """Reducer: set-union of completed agents, keeping first-completion order"""
+    return list(dict.fromkeys([*left, *right]))
+
+def _add_messages(left: list[BaseMessage], right: list[BaseMessage]) -> list[BaseMessage]:
+    """Reducer: LangGraph's add_messages, imported on first use"""
+    from langgraph.graph.message import add_messages
+    return add_messages(left, right)
+
 class AnalysisState(TypedDict):
     """State for the analysis workflow"""
-    messages: Annotated[list[BaseMessage], add_messages]
+    messages: Annotated[list[BaseMessage], _add_messages]
     parcel_id: str
-    property_data: PropertyData
+    property_data: Annotated[PropertyData, merge_property_data]
     current_agent: str
-    completed_agents: list[str]
-    errors: list[str]
+    completed_agents: Annotated[list[str], merge_completed]
+    errors: Annotated[list[str], operator.add]
     final_report: str | None
     timestamp: str
 
+# ============================================================================
+# Report Template
+# ============================================================================
+
+_REPORT_TMPL = """\
+# ZoneWise Property Analysis Report
+**Parcel ID:** {parcel_id}
+**Generated:** {timestamp}
+
+## Zoning Summary
+- **District:** {district}
+- **Max Height:** {max_height} ft
+- **Max Buildable:** {max_buildable}
+
+## Valuation Summary
+- **Estimated ARV:** {arv}
+- **Max Bid (70% rule):** {max_bid}
+- **Comparable Sales:** {comps} found
+
+## Permit Analysis
+- **Permit Risk Score:** {risk_score}/100
+- **Open Violations:** {violations}
+- **Historical Permits:** {permits}
+
+## Sun/Shadow Analysis
+- **Average Sun Hours:** {sun_hours} hrs/day
+- **3D Envelope:** {envelope}
+
+## Recommendation
+{recommendation}{errors}"""
+
+_FAILED_REPORT_TMPL = """\
+# ZoneWise Property Analysis Report
+**Parcel ID:** {parcel_id}
+**Generated:** {timestamp}
+
+## Recommendation
+{recommendation}
+
+Analysis failed for {parcel_id}: {first_error}{errors}"""
+
+# Errors at which the run counts as failed and only the short report is built
+FAILED_RUN_ERRORS = 3
+
+class _ReportFields(dict):
+    """format_map mapping that renders missing or None values as N/A"""
+    def __missing__(self, key: str) -> str:
+        return "N/A"
+    
+    def __getitem__(self, key: str) -> Any:
+        value = super().__getitem__(key)
+        return "N/A" if value is None else value
+
+def _fmt_currency(value: float | None) -> str:
+    return f"${value:,.0f}" if value else "N/A"
+
+def _fmt_sqft(value: float | None) -> str:
+    return f"{value:,.0f} sqft" if value else "N/A"
+
+def _fmt_errors(errors: list[str]) -> str:
+    """Trailing Errors section, or nothing when the run was clean"""
+    if not errors:
+        return ""
+    return "\n\n## Errors" + "".join(f"\n- {e}" for e in errors)
+
+_batch_timestamp: ContextVar[str | None] = ContextVar("batch_timestamp", default=None)
+
+def _timestamp() -> str:
+    """Run timestamp, shared by every analysis inside a batch_timestamp() block"""
+    return _batch_timestamp.get() or datetime.now().isoformat(timespec="seconds")
+
+@contextmanager
+def batch_timestamp():
+    """
+    Stamp every analysis run inside the block with one timestamp.
+    
+    Usage:
+        with batch_timestamp():
+            for parcel_id in parcel_ids:
+                await run_property_analysis(workflow, parcel_id)
+    """
+    token = _batch_timestamp.set(datetime.now().isoformat(timespec="seconds"))
+    try:
+        yield
+    finally:
+        _batch_timestamp.reset(token)
+
 # ============================================================================
 # Agent Nodes
 # ============================================================================
 
-async def zoning_agent_node(state: AnalysisState) -> AnalysisState:
+_AGENT = None
+
+def _get_agent():
+    """Build the skill agent once and reuse it across nodes and runs"""
+    global _AGENT
+    if _AGENT is None:
+        from zonewise_agent import create_agent
+        _AGENT = create_agent()
+    return _AGENT
+
+def _new_deps():
+    """Fresh per-run AgentDependencies (holds the run's loaded skill cache)"""
+    from zonewise_agent import AgentDependencies
+    return AgentDependencies()
+
+_COMBINED_AGENT = None
+
+def _get_combined_agent():
+    """Build the structured-output agent used by combined_analysis_node"""
+    global _COMBINED_AGENT
+    if _COMBINED_AGENT is None:
+        from zonewise_agent import create_agent
+        _COMBINED_AGENT = create_agent(result_type=FullAnalysis)
+    return _COMBINED_AGENT
+
+async def combined_analysis_node(state: AnalysisState) -> dict[str, Any]:
+    """
+    Combined Analysis Agent
+    
+    Answers the zoning, valuation, permit and envelope questions in a single
+    structured-output call instead of four separate agent runs.
+    """
+    parcel_id = state["parcel_id"]
+    
+    try:
+        agent = _get_combined_agent()
+        deps = _new_deps()
+        
+        query = (
+            f"Analyze parcel {parcel_id} and answer all of the following:\n"
+            "1. Zoning: what district is it in, what is the lot area, and what are the "
+            "development intensity metrics (setbacks, FAR, max height)?\n"
+            "2. Valuation: estimate the ARV and calculate the maximum bid assuming "
+            "$30,000 in repairs.\n"
+            "3. Permits: check the permit history and code violations, and score the "
+            "permit risk from 0-100.\n"
+            "4. Envelope: generate a building envelope using the zoning above, with max "
+            "buildable square footage and average daily sun hours."
+        )
+        
+        result = await agent.run(query, deps=deps)
+        analysis: FullAnalysis = result.data
+        
+        fields = analysis.model_dump()
+        dims = analysis.zoning_dims or {}
+        fields["max_height"] = dims.get("max_height_ft")
+        if dims.get("far") is not None and analysis.lot_area_sqft:
+            # Same deterministic envelope as envelope_agent_node, not the model's estimate
+            fields.update(compute_envelope(dims, analysis.lot_area_sqft))
+        
+        # Already validated as FullAnalysis, so skip re-validating as PropertyData
+        property_data = PropertyData.model_construct(
+            parcel_id=parcel_id,
+            **fields,
+            envelope_generated=fields["max_buildable_sqft"] is not None
+        )
+        
+        return {
+            "property_data": property_data,
+            "messages": [AIMessage(
+                content=f"[Analysis Agent] Completed combined analysis for {parcel_id}: {property_data.zoning_district}",
+                name="analysis_agent"
+            )],
+            "completed_agents": ["zoning", "valuation", "permit", "envelope"],
+        }
+        
+    except Exception as e:
+        return {"errors": [f"Analysis agent error: {str(e)}"]}
+
+async def zoning_agent_node(state: AnalysisState) -> dict[str, Any]:
     """
     Zoning Analysis Agent
     
@@ -91,40 +296,43 @@ async def zoning_agent_node(state: AnalysisState) -> AnalysisState:
     - Determine permitted uses
     """
     parcel_id = state["parcel_id"]
-    property_data = state["property_data"]
     
     try:
-        # Create agent with zoning skill
-        agent = create_agent()
-        deps = AgentDependencies()
+        agent = _get_agent()
+        deps = _new_deps()
         
         # Query zoning information
-        query = f"Analyze the zoning for parcel {parcel_id}. What district is it in and what are the development intensity metrics (setbacks, FAR, max height)?"
+        query = f"Analyze the zoning for parcel {parcel_id}. What district is it in, what is the lot area, and what are the development intensity metrics (setbacks, FAR, max height)?"
         
         result = await agent.run(query, deps=deps)
         
         # Update property data (in real implementation, parse the response)
-        property_data.zoning_district = "RS-10"  # Parsed from response
-        property_data.zoning_dims = {
-            "max_height_ft": 35,
-            "far": 0.35,
-            "front_setback_ft": 25,
-            "side_setback_ft": 7.5,
-            "rear_setback_ft": 20
-        }
+        property_data = PropertyData.model_construct(
+            parcel_id=parcel_id,
+            zoning_district="RS-10",  # Parsed from response
+            lot_area_sqft=7500,
+            zoning_dims={
+                "max_height_ft": 35,
+                "far": 0.35,
+                "front_setback_ft": 25,
+                "side_setback_ft": 7.5,
+                "rear_setback_ft": 20
+            }
+        )
         
-        state["messages"].append(AIMessage(
-            content=f"[Zoning Agent] Analyzed zoning for {parcel_id}: {property_data.zoning_district}",
-            name="zoning_agent"
-        ))
-        state["completed_agents"].append("zoning")
+        return {
+            "property_data": property_data,
+            "messages": [AIMessage(
+                content=f"[Zoning Agent] Analyzed zoning for {parcel_id}: {property_data.zoning_district}",
+                name="zoning_agent"
+            )],
+            "completed_agents": ["zoning"],
+        }
         
     except Exception as e:
-        state["errors"].append(f"Zoning agent error: {str(e)}")
-    
-    return state
+        return {"errors": [f"Zoning agent error: {str(e)}"]}
 
-async def valuation_agent_node(state: AnalysisState) -> AnalysisState:
+async def valuation_agent_node(state: AnalysisState) -> dict[str, Any]:
     """
     Property Valuation Agent
     
@@ -134,36 +342,39 @@ async def valuation_agent_node(state: AnalysisState) -> AnalysisState:
     - Calculate max bid
     """
     parcel_id = state["parcel_id"]
-    property_data = state["property_data"]
     
     try:
-        agent = create_agent()
-        deps = AgentDependencies()
+        agent = _get_agent()
+        deps = _new_deps()
         
         query = f"Estimate the ARV for parcel {parcel_id} and calculate the maximum bid assuming $30,000 in repairs."
         
         result = await agent.run(query, deps=deps)
         
         # Update property data
-        property_data.arv = 325000
-        property_data.max_bid = 165000
-        property_data.comparable_sales = [
-            {"address": "123 Main St", "price": 310000, "sqft": 1450},
-            {"address": "456 Oak Ave", "price": 340000, "sqft": 1550},
-        ]
+        property_data = PropertyData.model_construct(
+            parcel_id=parcel_id,
+            arv=325000,
+            max_bid=165000,
+            comparable_sales=[
+                {"address": "123 Main St", "price": 310000, "sqft": 1450},
+                {"address": "456 Oak Ave", "price": 340000, "sqft": 1550},
+            ]
+        )
         
-        state["messages"].append(AIMessage(
-            content=f"[Valuation Agent] ARV: ${property_data.arv:,.0f}, Max Bid: ${property_data.max_bid:,.0f}",
-            name="valuation_agent"
-        ))
-        state["completed_agents"].append("valuation")
+        return {
+            "property_data": property_data,
+            "messages": [AIMessage(
+                content=f"[Valuation Agent] ARV: ${property_data.arv:,.0f}, Max Bid: ${property_data.max_bid:,.0f}",
+                name="valuation_agent"
+            )],
+            "completed_agents": ["valuation"],
+        }
         
     except Exception as e:
-        state["errors"].append(f"Valuation agent error: {str(e)}")
-    
-    return state
+        return {"errors": [f"Valuation agent error: {str(e)}"]}
 
-async def permit_agent_node(state: AnalysisState) -> AnalysisState:
+async def permit_agent_node(state: AnalysisState) -> dict[str, Any]:
     """
     Permit Lookup Agent
     
@@ -173,36 +384,55 @@ async def permit_agent_node(state: AnalysisState) -> AnalysisState:
     - Assess permit risk
     """
     parcel_id = state["parcel_id"]
-    property_data = state["property_data"]
     
     try:
-        agent = create_agent()
-        deps = AgentDependencies()
+        agent = _get_agent()
+        deps = _new_deps()
         
         query = f"Check the permit history and code violations for parcel {parcel_id}."
         
         result = await agent.run(query, deps=deps)
         
         # Update property data
-        property_data.permit_history = [
-            {"type": "Roofing", "date": "2020-05-15", "status": "Closed"},
-            {"type": "Electrical", "date": "2018-03-20", "status": "Closed"},
-        ]
-        property_data.open_violations = []
-        property_data.permit_risk_score = 15
+        property_data = PropertyData.model_construct(
+            parcel_id=parcel_id,
+            permit_history=[
+                {"type": "Roofing", "date": "2020-05-15", "status": "Closed"},
+                {"type": "Electrical", "date": "2018-03-20", "status": "Closed"},
+            ],
+            open_violations=[],
+            permit_risk_score=15
+        )
         
-        state["messages"].append(AIMessage(
-            content=f"[Permit Agent] Risk score: {property_data.permit_risk_score}/100, No open violations",
-            name="permit_agent"
-        ))
-        state["completed_agents"].append("permit")
+        return {
+            "property_data": property_data,
+            "messages": [AIMessage(
+                content=f"[Permit Agent] Risk score: {property_data.permit_risk_score}/100, No open violations",
+                name="permit_agent"
+            )],
+            "completed_agents": ["permit"],
+        }
         
     except Exception as e:
-        state["errors"].append(f"Permit agent error: {str(e)}")
+        return {"errors": [f"Permit agent error: {str(e)}"]}
+
+def compute_envelope(dims: dict[str, Any], lot_area: float) -> dict[str, float | None]:
+    """
+    Deterministic building envelope from zoning DIMS.
     
-    return state
+    Args:
+        dims: Zoning DIMS with "far" and optionally "max_height_ft"
+        lot_area: Lot area in square feet
+    
+    Returns:
+        max_buildable_sqft (lot area × FAR) and max_height
+    """
+    return {
+        "max_buildable_sqft": lot_area * dims["far"],
+        "max_height": dims.get("max_height_ft"),
+    }
 
-async def envelope_agent_node(state: AnalysisState) -> AnalysisState:
+async def envelope_agent_node(state: AnalysisState) -> dict[str, Any]:
     """
     Visualization Agent
     
@@ -212,37 +442,64 @@ async def envelope_agent_node(state: AnalysisState) -> AnalysisState:
     - Sun/shadow analysis
     """
     parcel_id = state["parcel_id"]
-    property_data = state["property_data"]
+    zoning = state["property_data"]
     
     try:
-        agent = create_agent()
-        deps = AgentDependencies()
-        
         # Use zoning DIMS if available
-        dims = property_data.zoning_dims or {}
-        
-        query = f"Generate a building envelope for parcel {parcel_id} using {property_data.zoning_district or 'RS-10'} zoning."
+        dims = zoning.zoning_dims or {}
         
-        result = await agent.run(query, deps=deps)
-        
-        # Update property data
-        property_data.max_buildable_sqft = 2500
-        property_data.max_height = dims.get("max_height_ft", 35)
-        property_data.envelope_generated = True
-        property_data.avg_sun_hours = 8.5
+        if dims.get("far") is not None and zoning.lot_area_sqft:
+            # Structured DIMS make the envelope plain arithmetic; the LLM is
+            # only asked for the sun/shadow analysis
+            envelope = compute_envelope(dims, zoning.lot_area_sqft)
+            
+            agent = _get_agent()
+            deps = _new_deps()
+            
+            query = (
+                f"Run a sun/shadow analysis for parcel {parcel_id}: a building envelope of "
+                f"{envelope['max_buildable_sqft']:,.0f} sqft, up to {envelope['max_height'] or 'N/A'} ft tall. "
+                "What are the average daily sun hours?"
+            )
+            
+            result = await agent.run(query, deps=deps)
+            
+            property_data = PropertyData.model_construct(
+                parcel_id=parcel_id,
+                **envelope,
+                envelope_generated=True,
+                avg_sun_hours=8.5  # Parsed from response
+            )
+        else:
+            agent = _get_agent()
+            deps = _new_deps()
+            
+            query = f"Generate a building envelope for parcel {parcel_id} using {zoning.zoning_district or 'RS-10'} zoning."
+            
+            result = await agent.run(query, deps=deps)
+            
+            # Update property data
+            property_data = PropertyData.model_construct(
+                parcel_id=parcel_id,
+                max_buildable_sqft=2500,
+                max_height=dims.get("max_height_ft", 35),
+                envelope_generated=True,
+                avg_sun_hours=8.5
+            )
         
-        state["messages"].append(AIMessage(
-            content=f"[Envelope Agent] Max buildable: {property_data.max_buildable_sqft:,.0f} sqft, Generated 3D envelope",
-            name="envelope_agent"
-        ))
-        state["completed_agents"].append("envelope")
+        return {
+            "property_data": property_data,
+            "messages": [AIMessage(
+                content=f"[Envelope Agent] Max buildable: {property_data.max_buildable_sqft:,.0f} sqft, Generated 3D envelope",
+                name="envelope_agent"
+            )],
+            "completed_agents": ["envelope"],
+        }
         
     except Exception as e:
-        state["errors"].append(f"Envelope agent error: {str(e)}")
-    
-    return state
+        return {"errors": [f"Envelope agent error: {str(e)}"]}
 
-async def synthesizer_node(state: AnalysisState) -> AnalysisState:
+async def synthesizer_node(state: AnalysisState) -> dict[str, Any]:
     """
     Synthesizer Agent
     
@@ -251,33 +508,24 @@ async def synthesizer_node(state: AnalysisState) -> AnalysisState:
     property_data = state["property_data"]
     errors = state["errors"]
     
-    # Generate final report
-    report_lines = [
-        "# ZoneWise Property Analysis Report",
-        f"**Parcel ID:** {property_data.parcel_id}",
-        f"**Generated:** {state['timestamp']}",
-        "",
-        "## Zoning Summary",
-        f"- **District:** {property_data.zoning_district or 'Unknown'}",
-        f"- **Max Height:** {property_data.max_height or 'N/A'} ft",
-        f"- **Max Buildable:** {property_data.max_buildable_sqft or 'N/A':,.0f} sqft" if property_data.max_buildable_sqft else "- **Max Buildable:** N/A",
-        "",
-        "## Valuation Summary",
-        f"- **Estimated ARV:** ${property_data.arv:,.0f}" if property_data.arv else "- **Estimated ARV:** N/A",
-        f"- **Max Bid (70% rule):** ${property_data.max_bid:,.0f}" if property_data.max_bid else "- **Max Bid:** N/A",
-        f"- **Comparable Sales:** {len(property_data.comparable_sales)} found",
-        "",
-        "## Permit Analysis",
-        f"- **Permit Risk Score:** {property_data.permit_risk_score}/100",
-        f"- **Open Violations:** {len(property_data.open_violations)}",
-        f"- **Historical Permits:** {len(property_data.permit_history)}",
-        "",
-        "## Sun/Shadow Analysis",
-        f"- **Average Sun Hours:** {property_data.avg_sun_hours or 'N/A'} hrs/day",
-        f"- **3D Envelope:** {'Generated' if property_data.envelope_generated else 'Not generated'}",
-        "",
-        "## Recommendation",
-    ]
+    # Most agents failed (e.g. rate limits): skip the all-N/A full report
+    if len(errors) >= FAILED_RUN_ERRORS or (errors and not state["completed_agents"]):
+        recommendation = "❌ **FAILED** - Analysis did not complete"
+        report = _FAILED_REPORT_TMPL.format_map({
+            "parcel_id": property_data.parcel_id,
+            "timestamp": state["timestamp"],
+            "recommendation": recommendation,
+            "first_error": errors[0],
+            "errors": _fmt_errors(errors),
+        })
+        return {
+            "final_report": report,
+            "current_agent": "synthesizer",
+            "messages": [AIMessage(
+                content=f"[Synthesizer] Analysis failed with {len(errors)} error(s)",
+                name="synthesizer"
+            )],
+        }
     
     # Generate recommendation
     if property_data.arv and property_data.max_bid:
@@ -290,96 +538,163 @@ async def synthesizer_node(state: AnalysisState) -> AnalysisState:
     else:
         recommendation = "⚠️ **INCOMPLETE** - Insufficient data for recommendation"
     
-    report_lines.append(recommendation)
-    
-    if errors:
-        report_lines.extend([
-            "",
-            "## Errors",
-            *[f"- {e}" for e in errors]
-        ])
-    
-    state["final_report"] = "\n".join(report_lines)
-    
-    state["messages"].append(AIMessage(
-        content=f"[Synthesizer] Generated final report with recommendation: {recommendation}",
-        name="synthesizer"
-    ))
-    
-    return state
+    # Generate final report
+    report = _REPORT_TMPL.format_map(_ReportFields({
+        "parcel_id": property_data.parcel_id,
+        "timestamp": state["timestamp"],
+        "district": property_data.zoning_district or "Unknown",
+        "max_height": property_data.max_height or None,
+        "max_buildable": _fmt_sqft(property_data.max_buildable_sqft),
+        "arv": _fmt_currency(property_data.arv),
+        "max_bid": _fmt_currency(property_data.max_bid),
+        "comps": len(property_data.comparable_sales),
+        "risk_score": property_data.permit_risk_score,
+        "violations": len(property_data.open_violations),
+        "permits": len(property_data.permit_history),
+        "sun_hours": property_data.avg_sun_hours or None,
+        "envelope": "Generated" if property_data.envelope_generated else "Not generated",
+        "recommendation": recommendation,
+        "errors": _fmt_errors(errors),
+    }))
+    
+    return {
+        "final_report": report,
+        "current_agent": "synthesizer",
+        "messages": [AIMessage(
+            content=f"[Synthesizer] Generated final report with recommendation: {recommendation}",
+            name="synthesizer"
+        )],
+    }
 
 # ============================================================================
-# Router
+# Dispatch
 # ============================================================================
 
-def route_to_next_agent(state: AnalysisState) -> Literal["zoning", "valuation", "permit", "envelope", "synthesizer", "end"]:
-    """Route to the next agent based on completed agents"""
-    completed = state.get("completed_agents", [])
-    
-    # Define agent execution order
-    agent_order = ["zoning", "valuation", "permit", "envelope"]
-    
-    for agent in agent_order:
-        if agent not in completed:
-            return agent
-    
-    # All agents completed, go to synthesizer
-    if "synthesizer" not in completed:
-        return "synthesizer"
-    
-    return "end"
+# Agents that run concurrently in each phase of the split workflow
+PHASE1_AGENTS = ("zoning", "permit")
+PHASE2_AGENTS = ("valuation", "envelope")  # need zoning results
+
+def dispatch_phase1(state: AnalysisState) -> dict[str, Any]:
+    """Entry point for the independent agents (zoning, permit)"""
+    return {"current_agent": "phase1"}
+
+def dispatch_phase2(state: AnalysisState) -> dict[str, Any]:
+    """Join point after phase 1; valuation and envelope need zoning results"""
+    return {"current_agent": "phase2"}
+
+def _branch_input(state: AnalysisState) -> dict[str, Any]:
+    """The state keys the agent nodes read; the message history stays behind"""
+    return {"parcel_id": state["parcel_id"], "property_data": state["property_data"]}
+
+# LangGraph resolves these hints with get_type_hints(), and Send is only
+# imported at call time, so the return type stays a bare list (of Send)
+def fan_out_phase1(state: AnalysisState) -> list:
+    """Run zoning and permit concurrently"""
+    from langgraph.types import Send
+    branch_input = _branch_input(state)
+    return [Send(node, branch_input) for node in PHASE1_AGENTS]
+
+def fan_out_phase2(state: AnalysisState) -> list:
+    """Run valuation and envelope concurrently"""
+    from langgraph.types import Send
+    branch_input = _branch_input(state)
+    return [Send(node, branch_input) for node in PHASE2_AGENTS]
+
+# ============================================================================
+# Checkpointing
+# ============================================================================
+
+CHECKPOINT_DB = os.getenv("ZONEWISE_CHECKPOINT_DB", "zonewise.db")
+
+@asynccontextmanager
+async def _open_checkpointer():
+    """SQLite checkpointer shared by every worker pointed at CHECKPOINT_DB, open for the block"""
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    
+    async with AsyncSqliteSaver.from_conn_string(CHECKPOINT_DB) as saver:
+        await saver.conn.execute("PRAGMA journal_mode=WAL")
+        await saver.conn.execute("PRAGMA synchronous=NORMAL")
+        await saver.setup()
+        yield saver
+
+async def clear_checkpoints(workflow: StateGraph, thread_id: str) -> None:
+    """Delete all checkpoints stored for a thread to bound database growth"""
+    await workflow.checkpointer.adelete_thread(thread_id)
 
 # ============================================================================
 # Workflow Builder
 # ============================================================================
 
-def create_analysis_workflow() -> StateGraph:
+def create_analysis_workflow(split_agents: bool = False) -> StateGraph:
     """
     Create the multi-agent analysis workflow.
     
+    The graph is compiled once per process and the same instance is returned
+    on later calls; per-run state lives in the checkpointer keyed by
+    thread_id, so it is safe to share across concurrent runs. It checkpoints
+    in memory; use analysis_workflow() to share checkpoints through SQLite.
+    
+    Args:
+        split_agents: Run one agent call per concern (zoning, permit, valuation,
+            envelope) instead of the single combined call. Useful for debugging
+            an individual agent.
+    
     Returns:
         Compiled StateGraph workflow
     """
+    return _compile_workflow(split_agents)
+
+@asynccontextmanager
+async def analysis_workflow(split_agents: bool = False):
+    """
+    The compiled workflow checkpointed to CHECKPOINT_DB for the duration of the block.
+    
+    The SQLite connection is opened in the running event loop on entry and
+    closed on exit; the graph itself is still compiled only once per process.
+    
+    Usage:
+        async with analysis_workflow() as workflow:
+            result = await run_property_analysis(workflow, parcel_id)
+    """
+    async with _open_checkpointer() as saver:
+        yield create_analysis_workflow(split_agents).copy(update={"checkpointer": saver})
+
+@functools.lru_cache(maxsize=2)
+def _compile_workflow(split_agents: bool) -> StateGraph:
+    """Build and compile the graph with an in-memory checkpointer; cached per split_agents"""
+    from langgraph.checkpoint.memory import MemorySaver
+    from langgraph.graph import StateGraph, START, END
+    
     # Create workflow
     workflow = StateGraph(AnalysisState)
     
+    if not split_agents:
+        workflow.add_node("analysis", combined_analysis_node)
+        workflow.add_node("synthesizer", synthesizer_node)
+        workflow.add_edge(START, "analysis")
+        workflow.add_edge("analysis", "synthesizer")
+        workflow.add_edge("synthesizer", END)
+        return workflow.compile(checkpointer=MemorySaver())
+    
     # Add nodes
     workflow.add_node("zoning", zoning_agent_node)
     workflow.add_node("valuation", valuation_agent_node)
     workflow.add_node("permit", permit_agent_node)
     workflow.add_node("envelope", envelope_agent_node)
     workflow.add_node("synthesizer", synthesizer_node)
+    workflow.add_node("dispatch_phase1", dispatch_phase1)
+    workflow.add_node("dispatch_phase2", dispatch_phase2)
     
-    # Add conditional edges
-    workflow.add_conditional_edges(
-        "__start__",
-        route_to_next_agent,
-        {
-            "zoning": "zoning",
-            "valuation": "valuation",
-            "permit": "permit",
-            "envelope": "envelope",
-            "synthesizer": "synthesizer",
-            "end": END
-        }
-    )
-    
-    # Connect each agent to router
-    for agent in ["zoning", "valuation", "permit", "envelope"]:
-        workflow.add_conditional_edges(
-            agent,
-            route_to_next_agent,
-            {
-                "zoning": "zoning",
-                "valuation": "valuation",
-                "permit": "permit",
-                "envelope": "envelope",
-                "synthesizer": "synthesizer",
-                "end": END
-            }
-        )
+    # Phase 1: zoning and permit are independent
+    workflow.add_edge(START, "dispatch_phase1")
+    workflow.add_conditional_edges("dispatch_phase1", fan_out_phase1, list(PHASE1_AGENTS))
+    
+    # Phase 2: wait for both, then valuation and envelope in parallel
+    workflow.add_edge(list(PHASE1_AGENTS), "dispatch_phase2")
+    workflow.add_conditional_edges("dispatch_phase2", fan_out_phase2, list(PHASE2_AGENTS))
     
-    # Synthesizer goes to end
+    # Join at synthesizer, then end
+    workflow.add_edge(list(PHASE2_AGENTS), "synthesizer")
     workflow.add_edge("synthesizer", END)
     
     return workflow.compile(checkpointer=MemorySaver())
@@ -396,14 +711,70 @@ async def run_property_analysis(
     """
     Run full property analysis workflow.
     
+    Without a thread_id, results are cached per parcel for 10 minutes so
+    repeated requests skip the agent calls, across analysis_workflow()
+    blocks too. Runs with errors aren't cached, and keep their checkpoints
+    for inspection until the parcel is run again.
+    
     Args:
         workflow: Compiled workflow
         parcel_id: Property parcel ID
-        thread_id: Optional thread ID for checkpointing
+        thread_id: Optional thread ID for checkpointing (bypasses the cache)
     
     Returns:
         Final state with all analysis results
     """
+    if thread_id is not None:
+        return await _run_workflow(workflow, parcel_id, thread_id)
+    
+    split_agents = "zoning" in workflow.nodes  # the combined graph has no per-agent nodes
+    live = _Uncached(workflow)
+    try:
+        return await _cached_run(parcel_id, split_agents, live)
+    except _FailedRun as failed:
+        return failed.state
+    finally:
+        live.value = None  # a cache key must not pin the block's closed checkpointer
+
+class _Uncached:
+    """Passes a value to a cached function without making it part of the key"""
+    __slots__ = ("value",)
+    
+    def __init__(self, value: Any):
+        self.value = value
+    
+    def __hash__(self) -> int:
+        return 0
+    
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Uncached)
+
+class _FailedRun(Exception):
+    """Raised out of _cached_run so alru_cache drops the entry before anyone sees it"""
+    def __init__(self, state: AnalysisState):
+        super().__init__(state["errors"])
+        self.state = state
+
+@alru_cache(maxsize=1024, ttl=600)
+async def _cached_run(parcel_id: str, split_agents: bool, live: _Uncached) -> AnalysisState:
+    """Cached full run, keyed on (parcel_id, split_agents); live carries the workflow"""
+    workflow = live.value
+    
+    # Start from a clean thread: the reducers would otherwise merge this run
+    # into a previous failed run's state (its errors and completed agents)
+    await clear_checkpoints(workflow, parcel_id)
+    
+    final_state = await _run_workflow(workflow, parcel_id, parcel_id)
+    if final_state["errors"]:
+        raise _FailedRun(final_state)
+    
+    # The result lives in the cache
+    await clear_checkpoints(workflow, parcel_id)
+    
+    return final_state
+
+async def _run_workflow(workflow: StateGraph, parcel_id: str, thread_id: str) -> AnalysisState:
+    """Invoke the workflow for a parcel on the given checkpoint thread"""
     # Initialize state
     initial_state: AnalysisState = {
         "messages": [HumanMessage(content=f"Analyze property: {parcel_id}")],
@@ -413,11 +784,11 @@ async def run_property_analysis(
         "completed_agents": [],
         "errors": [],
         "final_report": None,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _timestamp()
     }
     
     # Config for checkpointing
-    config = {"configurable": {"thread_id": thread_id or parcel_id}}
+    config = {"configurable": {"thread_id": thread_id}}
     
     # Run workflow
     final_state = await workflow.ainvoke(initial_state, config)
@@ -428,6 +799,13 @@ async def run_property_analysis(
 # Parallel Execution (Alternative)
 # ============================================================================
 
+async def _settle(coro) -> tuple[bool, Any]:
+    """Await coro as (ok, result_or_exception) so a failure doesn't cancel TaskGroup siblings"""
+    try:
+        return True, await coro
+    except Exception as e:
+        return False, e
+
 async def run_parallel_analysis(parcel_id: str) -> AnalysisState:
     """
     Run agents in parallel for faster analysis.
@@ -439,36 +817,40 @@ async def run_parallel_analysis(parcel_id: str) -> AnalysisState:
     errors = []
     
     # Phase 1: Run zoning and permit in parallel
-    zoning_task = asyncio.create_task(run_zoning_analysis(parcel_id))
-    permit_task = asyncio.create_task(run_permit_analysis(parcel_id))
+    async with asyncio.TaskGroup() as tg:
+        zoning_task = tg.create_task(_settle(run_zoning_analysis(parcel_id)))
+        permit_task = tg.create_task(_settle(run_permit_analysis(parcel_id)))
     
-    zoning_result, permit_result = await asyncio.gather(zoning_task, permit_task, return_exceptions=True)
+    zoning_ok, zoning_result = zoning_task.result()
+    permit_ok, permit_result = permit_task.result()
     
-    if isinstance(zoning_result, Exception):
+    if not zoning_ok:
         errors.append(f"Zoning error: {zoning_result}")
     else:
         property_data.zoning_district = zoning_result.get("district")
         property_data.zoning_dims = zoning_result.get("dims")
     
-    if isinstance(permit_result, Exception):
+    if not permit_ok:
         errors.append(f"Permit error: {permit_result}")
     else:
         property_data.permit_history = permit_result.get("history", [])
         property_data.open_violations = permit_result.get("violations", [])
     
     # Phase 2: Run valuation and envelope (need zoning data)
-    valuation_task = asyncio.create_task(run_valuation_analysis(parcel_id, property_data.zoning_dims))
-    envelope_task = asyncio.create_task(run_envelope_analysis(parcel_id, property_data.zoning_dims))
+    async with asyncio.TaskGroup() as tg:
+        valuation_task = tg.create_task(_settle(run_valuation_analysis(parcel_id, property_data.zoning_dims)))
+        envelope_task = tg.create_task(_settle(run_envelope_analysis(parcel_id, property_data.zoning_dims)))
     
-    valuation_result, envelope_result = await asyncio.gather(valuation_task, envelope_task, return_exceptions=True)
+    valuation_ok, valuation_result = valuation_task.result()
+    envelope_ok, envelope_result = envelope_task.result()
     
-    if isinstance(valuation_result, Exception):
+    if not valuation_ok:
         errors.append(f"Valuation error: {valuation_result}")
     else:
         property_data.arv = valuation_result.get("arv")
         property_data.max_bid = valuation_result.get("max_bid")
     
-    if isinstance(envelope_result, Exception):
+    if not envelope_ok:
         errors.append(f"Envelope error: {envelope_result}")
     else:
         property_data.envelope_generated = True
@@ -483,11 +865,13 @@ async def run_parallel_analysis(parcel_id: str) -> AnalysisState:
         "completed_agents": ["zoning", "permit", "valuation", "envelope"],
         "errors": errors,
         "final_report": None,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _timestamp()
     }
     
     # Generate report
-    state = await synthesizer_node(state)
+    update = await synthesizer_node(state)
+    state["final_report"] = update["final_report"]
+    state["messages"].extend(update["messages"])
     
     return state
 
@@ -513,13 +897,17 @@ async def main():
     """Run analysis from command line"""
     import sys
     
+    if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help"):
+        print("Usage: python langgraph_workflow.py [parcel_id]")
+        return
+    
     parcel_id = sys.argv[1] if len(sys.argv) > 1 else "2512345"
     
     print(f"\n🏠 Running ZoneWise Multi-Agent Analysis for {parcel_id}")
     print("=" * 60)
     
-    workflow = create_analysis_workflow()
-    result = await run_property_analysis(workflow, parcel_id)
+    async with analysis_workflow() as workflow:
+        result = await run_property_analysis(workflow, parcel_id)
     
     print("\n" + result["final_report"])
     
@@ -529,4 +917,11 @@ async def main():
             print(f"  - {error}")
 
 if __name__ == "__main__":
+    # Optional faster event loop
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
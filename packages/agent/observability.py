@@ -26,12 +26,18 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
+import contextvars
 import os
+import queue
+import random
+import threading
 import time
+from collections import defaultdict, deque
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable
+from typing import Any, Callable, NamedTuple
 
 # Conditional import - graceful fallback if logfire not installed
 try:
@@ -53,6 +59,7 @@ class LogfireConfig:
     environment: str = "development"
     send_to_logfire: bool = True
     console_output: bool = True
+    otlp_endpoint: str | None = None  # Extra OTLP trace exporter (batched)
     
     @classmethod
     def from_env(cls) -> "LogfireConfig":
@@ -61,7 +68,8 @@ class LogfireConfig:
             service_name=os.getenv("LOGFIRE_SERVICE", "skill-agent"),
             environment=os.getenv("LOGFIRE_ENV", "development"),
             send_to_logfire=os.getenv("LOGFIRE_ENABLED", "true").lower() == "true",
-            console_output=os.getenv("LOGFIRE_CONSOLE", "true").lower() == "true"
+            console_output=os.getenv("LOGFIRE_CONSOLE", "true").lower() == "true",
+            otlp_endpoint=os.getenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT")
         )
 
 # ============================================================================
@@ -95,13 +103,15 @@ def init_logfire(config: LogfireConfig | None = None) -> bool:
         logfire.configure(
             service_name=config.service_name,
             send_to_logfire=config.send_to_logfire,
-            console=config.console_output
+            console=config.console_output,
+            additional_span_processors=_batch_processors(config)
         )
         
         # Set up Pydantic AI instrumentation
         logfire.instrument_pydantic_ai()
         
         _initialized = True
+        _start_log_thread()
         logfire.info(
             "ZoneWise observability initialized",
             project=config.project_name,
@@ -113,17 +123,132 @@ def init_logfire(config: LogfireConfig | None = None) -> bool:
         print(f"[Observability] Failed to initialize Logfire: {e}")
         return False
 
+def _batch_processors(config: LogfireConfig) -> list[Any]:
+    """Batched exporter for an extra OTLP backend, so span export never blocks the caller"""
+    if not config.otlp_endpoint:
+        return []
+    
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    
+    return [BatchSpanProcessor(
+        OTLPSpanExporter(endpoint=config.otlp_endpoint),
+        max_queue_size=2048,
+        schedule_delay_millis=500,
+        max_export_batch_size=512
+    )]
+
+# ============================================================================
+# Background Log Emission
+# ============================================================================
+
+# Log events are queued and emitted on a daemon thread so hot paths only pay
+# for an enqueue. Each event carries a copy of the caller's context, so it
+# still attaches to whichever span was active when it was logged.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_thread: threading.Thread | None = None
+_log_thread_lock = threading.Lock()
+
+def _drain_logs():
+    while True:
+        item = _log_queue.get()
+        if isinstance(item, threading.Event):
+            item.set()  # flush_logs() marker: everything queued before it is out
+            continue
+        ctx, emit, message, attributes = item
+        try:
+            ctx.run(emit, message, **attributes)
+        except Exception as e:
+            print(f"[Observability] Failed to emit log: {e}")
+
+def _start_log_thread():
+    global _log_thread
+    with _log_thread_lock:
+        if _log_thread is not None:
+            return
+        _log_thread = threading.Thread(target=_drain_logs, name="zonewise-log-emitter", daemon=True)
+        _log_thread.start()
+    atexit.register(flush_logs)
+
+def _enqueue_log(emit: Callable[..., Any], message: str, **attributes):
+    if _log_thread is None:
+        _start_log_thread()
+    _log_queue.put((contextvars.copy_context(), emit, message, attributes))
+
+def flush_logs(timeout: float = 5.0):
+    """Wait until every log event queued so far is emitted; the emitter keeps running"""
+    if _log_thread is None:
+        return
+    done = threading.Event()
+    _log_queue.put(done)
+    done.wait(timeout)
+
+# ============================================================================
+# Sampling
+# ============================================================================
+
+# Fraction of skill-load / agent-run traces exported as spans
+TRACE_SAMPLE_RATE = float(os.getenv("ZW_TRACE_SAMPLE", "0.05"))
+# Unsampled traces at least this slow are still recorded
+SLOW_TRACE_MS = float(os.getenv("ZW_TRACE_SLOW_MS", "1000"))
+
+def _should_sample() -> bool:
+    """Head-based sampling decision, made when a trace starts"""
+    return LOGFIRE_AVAILABLE and _initialized and random.random() < TRACE_SAMPLE_RATE
+
+def _effective_sample_rate(trace: _TimedTrace) -> float:
+    """Failed and slow traces are recorded whether sampled or not, so they count once"""
+    if not trace.success or trace.duration_ms >= SLOW_TRACE_MS:
+        return 1.0
+    return TRACE_SAMPLE_RATE
+
+def _record_unsampled(span_name: str, trace: _TimedTrace, **attributes):
+    """Tail bias: record an unsampled trace anyway if it failed or ran slow"""
+    if not (LOGFIRE_AVAILABLE and _initialized):
+        return
+    if trace.success and trace.duration_ms < SLOW_TRACE_MS:
+        return
+    _enqueue_log(
+        logfire.warn if trace.success else logfire.error,
+        span_name,
+        duration_ms=trace.duration_ms,
+        success=trace.success,
+        error=trace.error,
+        sample_rate=1.0,
+        **attributes
+    )
+
 # ============================================================================
 # Skill Tracing
 # ============================================================================
 
-@dataclass
-class SkillTrace:
+# Offset from the monotonic clock to wall-clock time, used for display only
+_WALL_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+class _TimedTrace:
+    """Derived timing for traces stamped with time.monotonic_ns()"""
+    __slots__ = ()
+    
+    @property
+    def duration_ms(self) -> float:
+        return (self.ended_ns - self.started_ns) / 1e6 if self.ended_ns else 0
+    
+    @property
+    def started_at(self) -> datetime:
+        return datetime.fromtimestamp((self.started_ns + _WALL_OFFSET_NS) / 1e9)
+    
+    @property
+    def ended_at(self) -> datetime | None:
+        if not self.ended_ns:
+            return None
+        return datetime.fromtimestamp((self.ended_ns + _WALL_OFFSET_NS) / 1e9)
+
+@dataclass(slots=True)
+class SkillTrace(_TimedTrace):
     """Trace data for a skill load"""
     skill_name: str
-    started_at: datetime
-    ended_at: datetime | None = None
-    duration_ms: float = 0
+    started_ns: int = 0
+    ended_ns: int = 0
     success: bool = True
     error: str | None = None
     tokens_estimated: int = 0
@@ -134,22 +259,26 @@ def trace_skill_load(skill_name: str, tokens_estimated: int = 0):
     """
     Context manager to trace skill loading.
     
+    Only TRACE_SAMPLE_RATE of loads are exported as spans; unsampled loads
+    that fail or exceed SLOW_TRACE_MS are still recorded on exit.
+    
     Usage:
         with trace_skill_load("zoning-analysis", tokens_estimated=1500):
             skill = await loader.load_skill("zoning-analysis")
     """
     trace = SkillTrace(
         skill_name=skill_name,
-        started_at=datetime.now(),
+        started_ns=time.monotonic_ns(),
         tokens_estimated=tokens_estimated
     )
-    start_time = time.perf_counter()
     
-    if LOGFIRE_AVAILABLE and _initialized:
+    if _should_sample():
         with logfire.span(
             f"skill.load.{skill_name}",
+            span_kind="skill.load",
             skill_name=skill_name,
-            tokens_estimated=tokens_estimated
+            tokens_estimated=tokens_estimated,
+            sample_rate=TRACE_SAMPLE_RATE
         ) as span:
             try:
                 yield trace
@@ -160,12 +289,12 @@ def trace_skill_load(skill_name: str, tokens_estimated: int = 0):
                 span.set_attribute("error", str(e))
                 raise
             finally:
-                trace.ended_at = datetime.now()
-                trace.duration_ms = (time.perf_counter() - start_time) * 1000
+                trace.ended_ns = time.monotonic_ns()
                 span.set_attribute("duration_ms", trace.duration_ms)
                 span.set_attribute("success", trace.success)
+                span.set_attribute("sample_rate", _effective_sample_rate(trace))
     else:
-        # Fallback without Logfire
+        # Not sampled (or Logfire unavailable)
         try:
             yield trace
             trace.success = True
@@ -174,8 +303,14 @@ def trace_skill_load(skill_name: str, tokens_estimated: int = 0):
             trace.error = str(e)
             raise
         finally:
-            trace.ended_at = datetime.now()
-            trace.duration_ms = (time.perf_counter() - start_time) * 1000
+            trace.ended_ns = time.monotonic_ns()
+            _record_unsampled(
+                f"skill.load.{skill_name}",
+                trace,
+                span_kind="skill.load",
+                skill_name=skill_name,
+                tokens_estimated=tokens_estimated
+            )
 
 @contextmanager
 def trace_reference_load(skill_name: str, reference_name: str):
@@ -194,7 +329,8 @@ def trace_reference_load(skill_name: str, reference_name: str):
     
     duration_ms = (time.perf_counter() - start_time) * 1000
     if LOGFIRE_AVAILABLE and _initialized:
-        logfire.debug(
+        _enqueue_log(
+            logfire.debug,
             "Reference loaded",
             skill_name=skill_name,
             reference_name=reference_name,
@@ -205,14 +341,13 @@ def trace_reference_load(skill_name: str, reference_name: str):
 # Agent Tracing
 # ============================================================================
 
-@dataclass
-class AgentTrace:
+@dataclass(slots=True)
+class AgentTrace(_TimedTrace):
     """Trace data for an agent run"""
     agent_name: str
     query: str
-    started_at: datetime
-    ended_at: datetime | None = None
-    duration_ms: float = 0
+    started_ns: int = 0
+    ended_ns: int = 0
     success: bool = True
     error: str | None = None
     skills_loaded: list[str] = field(default_factory=list)
@@ -225,25 +360,30 @@ def trace_agent_run(agent_name: str, query: str = "", **metadata):
     """
     Context manager to trace agent execution.
     
+    Sampled like trace_skill_load; failed and slow runs are always recorded.
+    Caller metadata is recorded as one "metadata" attribute, so its keys
+    can't collide with the trace's own (duration_ms, success, ...).
+    
     Usage:
         with trace_agent_run("property-analysis", parcel_id="123") as trace:
             result = await agent.run(query, deps=deps)
-            trace.skills_loaded = deps.loaded_skills.keys()
+            trace.skills_loaded = list(deps.loaded_skills)
     """
     trace = AgentTrace(
         agent_name=agent_name,
         query=query,
-        started_at=datetime.now(),
+        started_ns=time.monotonic_ns(),
         metadata=metadata
     )
-    start_time = time.perf_counter()
     
-    if LOGFIRE_AVAILABLE and _initialized:
+    if _should_sample():
         with logfire.span(
             f"agent.run.{agent_name}",
+            span_kind="agent.run",
             agent_name=agent_name,
             query=query[:100] if query else "",
-            **metadata
+            sample_rate=TRACE_SAMPLE_RATE,
+            metadata=metadata
         ) as span:
             try:
                 yield trace
@@ -259,14 +399,16 @@ def trace_agent_run(agent_name: str, query: str = "", **metadata):
                 )
                 raise
             finally:
-                trace.ended_at = datetime.now()
-                trace.duration_ms = (time.perf_counter() - start_time) * 1000
+                trace.ended_ns = time.monotonic_ns()
                 span.set_attribute("duration_ms", trace.duration_ms)
                 span.set_attribute("success", trace.success)
-                span.set_attribute("skills_loaded", trace.skills_loaded)
+                span.set_attribute("sample_rate", _effective_sample_rate(trace))
+                # A list of str is a native OTel attribute; anything else gets JSON-encoded
+                span.set_attribute("skills_loaded", list(trace.skills_loaded))
                 span.set_attribute("tokens_input", trace.tokens_input)
                 span.set_attribute("tokens_output", trace.tokens_output)
     else:
+        # Not sampled (or Logfire unavailable)
         try:
             yield trace
             trace.success = True
@@ -275,34 +417,102 @@ def trace_agent_run(agent_name: str, query: str = "", **metadata):
             trace.error = str(e)
             raise
         finally:
-            trace.ended_at = datetime.now()
-            trace.duration_ms = (time.perf_counter() - start_time) * 1000
+            trace.ended_ns = time.monotonic_ns()
+            _record_unsampled(
+                f"agent.run.{agent_name}",
+                trace,
+                span_kind="agent.run",
+                agent_name=agent_name,
+                query=query[:100] if query else "",
+                skills_loaded=list(trace.skills_loaded),
+                metadata=metadata
+            )
+
+class _LocalTrace:
+    """Times a trace without exporting it; used when Logfire isn't installed"""
+    __slots__ = ("trace",)
+    
+    def __init__(self, trace: _TimedTrace):
+        self.trace = trace
+    
+    def __enter__(self) -> _TimedTrace:
+        self.trace.started_ns = time.monotonic_ns()
+        return self.trace
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.trace.ended_ns = time.monotonic_ns()
+        if isinstance(exc, Exception):
+            self.trace.success = False
+            self.trace.error = str(exc)
+        return False
+
+if not LOGFIRE_AVAILABLE:
+    # Nothing can be exported, so skip sampling and the generator frame, not the timing
+    def trace_skill_load(skill_name: str, tokens_estimated: int = 0):
+        return _LocalTrace(SkillTrace(skill_name=skill_name, tokens_estimated=tokens_estimated))
+    
+    def trace_agent_run(agent_name: str, query: str = "", **metadata):
+        return _LocalTrace(AgentTrace(agent_name=agent_name, query=query, metadata=metadata))
 
 # ============================================================================
 # Metrics
 # ============================================================================
 
+@dataclass(slots=True)
+class DurationStats:
+    """Running duration statistics (Welford's online algorithm)"""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = float("inf")
+    max: float = 0.0
+    
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+    
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+class SkillLoadEvent(NamedTuple):
+    """One recorded skill load, kept in the bounded recent-events window"""
+    timestamp: float  # time.time()
+    skill_name: str
+    duration_ms: float
+    success: bool
+
+# Capacity of the recent-events ring buffer; totals are kept separately
+RECENT_LOADS_CAPACITY = int(os.getenv("ZW_METRICS_RECENT", "1024"))
+
 class SkillMetrics:
-    """Aggregated metrics for skill usage"""
+    """Aggregated metrics for skill usage (safe to record from multiple threads)
     
-    def __init__(self):
-        self.skill_loads: dict[str, int] = {}
-        self.skill_durations: dict[str, list[float]] = {}
-        self.skill_errors: dict[str, int] = {}
+    Memory is constant: per-skill running aggregates plus a fixed-size ring
+    buffer of the most recent load events.
+    """
+    
+    def __init__(self, recent_capacity: int = RECENT_LOADS_CAPACITY):
+        self.skill_loads: defaultdict[str, int] = defaultdict(int)
+        self.skill_durations: defaultdict[str, DurationStats] = defaultdict(DurationStats)
+        self.skill_errors: defaultdict[str, int] = defaultdict(int)
         self.total_tokens: int = 0
+        self.recent: deque[SkillLoadEvent] = deque(maxlen=recent_capacity)
+        self._lock = threading.Lock()
     
     def record_load(self, skill_name: str, duration_ms: float, success: bool, tokens: int = 0):
         """Record a skill load event"""
-        self.skill_loads[skill_name] = self.skill_loads.get(skill_name, 0) + 1
-        
-        if skill_name not in self.skill_durations:
-            self.skill_durations[skill_name] = []
-        self.skill_durations[skill_name].append(duration_ms)
-        
-        if not success:
-            self.skill_errors[skill_name] = self.skill_errors.get(skill_name, 0) + 1
-        
-        self.total_tokens += tokens
+        with self._lock:
+            self.skill_loads[skill_name] += 1
+            self.skill_durations[skill_name].add(duration_ms)
+            if not success:
+                self.skill_errors[skill_name] += 1
+            self.total_tokens += tokens
+            self.recent.append(SkillLoadEvent(time.time(), skill_name, duration_ms, success))
         
         if LOGFIRE_AVAILABLE and _initialized:
             logfire.metric_counter("skill_loads_total", 1, skill_name=skill_name)
@@ -312,24 +522,35 @@ class SkillMetrics:
     
     def get_stats(self, skill_name: str) -> dict[str, Any]:
         """Get statistics for a skill"""
-        durations = self.skill_durations.get(skill_name, [])
-        return {
-            "loads": self.skill_loads.get(skill_name, 0),
-            "errors": self.skill_errors.get(skill_name, 0),
-            "avg_duration_ms": sum(durations) / len(durations) if durations else 0,
-            "min_duration_ms": min(durations) if durations else 0,
-            "max_duration_ms": max(durations) if durations else 0
-        }
+        with self._lock:
+            durations = self.skill_durations.get(skill_name) or DurationStats()
+            return {
+                "loads": self.skill_loads.get(skill_name, 0),
+                "errors": self.skill_errors.get(skill_name, 0),
+                "avg_duration_ms": durations.mean,
+                "min_duration_ms": durations.min if durations.count else 0,
+                "max_duration_ms": durations.max,
+                "stddev_duration_ms": durations.variance ** 0.5
+            }
+    
+    def recent_loads(self, skill_name: str | None = None) -> list[SkillLoadEvent]:
+        """Most recent load events (oldest first), optionally for one skill"""
+        with self._lock:
+            events = list(self.recent)
+        if skill_name is None:
+            return events
+        return [e for e in events if e.skill_name == skill_name]
     
     def get_summary(self) -> dict[str, Any]:
         """Get overall metrics summary"""
-        return {
-            "total_loads": sum(self.skill_loads.values()),
-            "total_errors": sum(self.skill_errors.values()),
-            "total_tokens": self.total_tokens,
-            "skills_used": list(self.skill_loads.keys()),
-            "most_used": max(self.skill_loads, key=self.skill_loads.get) if self.skill_loads else None
-        }
+        with self._lock:
+            return {
+                "total_loads": sum(self.skill_loads.values()),
+                "total_errors": sum(self.skill_errors.values()),
+                "total_tokens": self.total_tokens,
+                "skills_used": list(self.skill_loads.keys()),
+                "most_used": max(self.skill_loads, key=self.skill_loads.get) if self.skill_loads else None
+            }
 
 # Global metrics instance
 metrics = SkillMetrics()
@@ -341,7 +562,8 @@ metrics = SkillMetrics()
 def log_skill_decision(query: str, skills_selected: list[str], reasoning: str = ""):
     """Log which skills were selected for a query"""
     if LOGFIRE_AVAILABLE and _initialized:
-        logfire.info(
+        _enqueue_log(
+            logfire.info,
             "Skill selection",
             query=query[:100],
             skills_selected=skills_selected,
@@ -351,7 +573,8 @@ def log_skill_decision(query: str, skills_selected: list[str], reasoning: str =
 def log_workflow_phase(workflow_id: str, phase: str, status: str, **data):
     """Log a workflow phase transition"""
     if LOGFIRE_AVAILABLE and _initialized:
-        logfire.info(
+        _enqueue_log(
+            logfire.info,
             f"Workflow phase: {phase}",
             workflow_id=workflow_id,
             phase=phase,
@@ -362,14 +585,14 @@ def log_workflow_phase(workflow_id: str, phase: str, status: str, **data):
 def log_error(message: str, **context):
     """Log an error with context"""
     if LOGFIRE_AVAILABLE and _initialized:
-        logfire.error(message, **context)
+        _enqueue_log(logfire.error, message, **context)
     else:
         print(f"[ERROR] {message} | {context}")
 
 def log_warning(message: str, **context):
     """Log a warning with context"""
     if LOGFIRE_AVAILABLE and _initialized:
-        logfire.warn(message, **context)
+        _enqueue_log(logfire.warn, message, **context)
     else:
         print(f"[WARN] {message} | {context}")
 
@@ -377,36 +600,93 @@ def log_warning(message: str, **context):
 # Dashboard Queries
 # ============================================================================
 
+# Run once against the span store (Postgres). Spans are filtered on the
+# span_kind attribute set by trace_skill_load / trace_agent_run rather than
+# span_name LIKE, so the planner can use an equality probe on the index.
+# spans_hourly is a rollup the dashboards read instead of scanning raw spans;
+# counts are weighted by 1/sample_rate to undo head sampling.
+DASHBOARD_MIGRATIONS = [
+    """
+        CREATE INDEX IF NOT EXISTS ix_spans_kind_ts
+        ON spans (span_kind, timestamp)
+        INCLUDE (skill_name, agent_name, duration_ms, success)
+    """,
+    
+    """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS spans_hourly AS
+        SELECT date_trunc('hour', timestamp) as hour,
+               span_kind,
+               skill_name,
+               agent_name,
+               SUM(1.0 / COALESCE(sample_rate, 1.0)) as loads,
+               SUM(duration_ms / COALESCE(sample_rate, 1.0)) as sum_duration_ms,
+               SUM(CASE WHEN success THEN 0 ELSE 1 END) as errors
+        FROM spans
+        WHERE span_kind IN ('skill.load', 'agent.run')
+        GROUP BY 1, 2, 3, 4
+    """,
+    
+    # Required for REFRESH ... CONCURRENTLY
+    """
+        CREATE UNIQUE INDEX IF NOT EXISTS ux_spans_hourly
+        ON spans_hourly (span_kind, hour, skill_name, agent_name)
+    """,
+    
+    # Failed skill loads only: serves both errors_by_skill queries index-only
+    """
+        CREATE INDEX IF NOT EXISTS ix_spans_skill_errors
+        ON spans (skill_name, timestamp)
+        INCLUDE (error)
+        WHERE span_kind = 'skill.load' AND success = false
+    """,
+]
+
+# Schedule every 5 minutes (e.g. pg_cron)
+DASHBOARD_ROLLUP_REFRESH = "REFRESH MATERIALIZED VIEW CONCURRENTLY spans_hourly"
+
 DASHBOARD_QUERIES = {
     "skill_usage_24h": """
-        SELECT skill_name, COUNT(*) as loads, AVG(duration_ms) as avg_duration
-        FROM spans
-        WHERE span_name LIKE 'skill.load.%'
-        AND timestamp > NOW() - INTERVAL '24 hours'
+        SELECT skill_name,
+               SUM(loads) as loads,
+               SUM(sum_duration_ms) / NULLIF(SUM(loads), 0) as avg_duration
+        FROM spans_hourly
+        WHERE span_kind = 'skill.load'
+        AND hour > NOW() - INTERVAL '24 hours'
         GROUP BY skill_name
         ORDER BY loads DESC
     """,
     
     "agent_performance_24h": """
-        SELECT agent_name, 
-               COUNT(*) as runs,
-               AVG(duration_ms) as avg_duration,
-               SUM(CASE WHEN success THEN 0 ELSE 1 END) as errors
-        FROM spans
-        WHERE span_name LIKE 'agent.run.%'
-        AND timestamp > NOW() - INTERVAL '24 hours'
+        SELECT agent_name,
+               SUM(loads) as runs,
+               SUM(sum_duration_ms) / NULLIF(SUM(loads), 0) as avg_duration,
+               SUM(errors) as errors
+        FROM spans_hourly
+        WHERE span_kind = 'agent.run'
+        AND hour > NOW() - INTERVAL '24 hours'
         GROUP BY agent_name
     """,
     
-    "errors_by_skill": """
-        SELECT skill_name, COUNT(*) as error_count, 
-               array_agg(DISTINCT error) as errors
+    # Dashboard tile; failed traces are never sampled out, so COUNT(*) is exact
+    "errors_by_skill_counts": """
+        SELECT skill_name, COUNT(*) as error_count
         FROM spans
-        WHERE span_name LIKE 'skill.load.%'
+        WHERE span_kind = 'skill.load'
         AND success = false
         AND timestamp > NOW() - INTERVAL '7 days'
         GROUP BY skill_name
         ORDER BY error_count DESC
+    """,
+    
+    # Drill-down for one selected skill; $1 = skill_name
+    "errors_by_skill_detail": """
+        SELECT DISTINCT error
+        FROM spans
+        WHERE span_kind = 'skill.load'
+        AND success = false
+        AND skill_name = $1
+        AND timestamp > NOW() - INTERVAL '7 days'
+        LIMIT 50
     """
 }
 
@@ -424,6 +704,9 @@ def instrument_agent(agent_class):
             async def run(self, query, deps):
                 ...
     """
+    if not LOGFIRE_AVAILABLE:
+        return agent_class  # trace_agent_run is a no-op; leave run() unwrapped
+    
     original_run = agent_class.run
     
     async def instrumented_run(self, query: str, deps=None, **kwargs):
@@ -0,0 +1,293 @@
+"""
+Unit tests for the LangGraph analysis workflow.
+
+Usage:
+    uv run pytest packages/agent/tests/test_langgraph_workflow.py -v
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("langgraph")
+pytest.importorskip("langgraph.checkpoint.sqlite")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import langgraph_workflow
+from langgraph_workflow import (
+    FAILED_RUN_ERRORS,
+    FullAnalysis,
+    PropertyData,
+    analysis_workflow,
+    compute_envelope,
+    create_analysis_workflow,
+    envelope_agent_node,
+    merge_completed,
+    merge_property_data,
+    run_property_analysis,
+    synthesizer_node,
+)
+
+
+class FlakyAgent:
+    """Stands in for the combined agent: fails the first `failures` runs"""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.runs = 0
+
+    async def run(self, query, deps=None):
+        self.runs += 1
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("rate limited")
+        return SimpleNamespace(data=FullAnalysis(
+            zoning_district="RS-10",
+            zoning_dims={"far": 0.35, "max_height_ft": 35},
+            arv=325000,
+            max_bid=165000,
+            max_buildable_sqft=2500,
+        ))
+
+
+@pytest.fixture
+def checkpoint_db(tmp_path, monkeypatch):
+    path = tmp_path / "checkpoints.db"
+    monkeypatch.setattr(langgraph_workflow, "CHECKPOINT_DB", str(path))
+    langgraph_workflow._cached_run.cache_clear()
+    return path
+
+
+def test_create_workflow_without_event_loop():
+    """Compiling needs no running loop, and happens once per process"""
+    assert create_analysis_workflow() is create_analysis_workflow()
+    assert create_analysis_workflow(split_agents=True) is not create_analysis_workflow()
+
+
+@pytest.mark.asyncio
+async def test_analysis_workflow_closes_checkpointer(checkpoint_db, monkeypatch):
+    """The SQLite checkpointer is bound to the block and closed on exit"""
+    monkeypatch.setattr(langgraph_workflow, "_get_combined_agent", lambda: FlakyAgent())
+
+    async with analysis_workflow() as workflow:
+        assert workflow.checkpointer is not create_analysis_workflow().checkpointer
+        result = await run_property_analysis(workflow, "2512345", thread_id="t1")
+        conn = workflow.checkpointer.conn
+
+    assert result["errors"] == []
+    assert checkpoint_db.exists()
+    with pytest.raises(ValueError):
+        await conn.execute("SELECT 1")  # closed with the block
+
+
+@pytest.mark.asyncio
+async def test_retry_after_failed_run(checkpoint_db, monkeypatch):
+    """A retried parcel starts clean instead of inheriting the failed run's errors"""
+    agent = FlakyAgent(failures=1)
+    monkeypatch.setattr(langgraph_workflow, "_get_combined_agent", lambda: agent)
+
+    async with analysis_workflow() as workflow:
+        failed = await run_property_analysis(workflow, "2512345")
+        assert failed["errors"]
+        assert "FAILED" in failed["final_report"]
+
+        retried = await run_property_analysis(workflow, "2512345")
+
+    assert retried["errors"] == []
+    assert retried["completed_agents"] == ["zoning", "valuation", "permit", "envelope"]
+    assert "FAILED" not in retried["final_report"]
+
+
+@pytest.mark.asyncio
+async def test_cached_run_hits_across_blocks(checkpoint_db, monkeypatch):
+    """A parcel analysed in one block is served from the cache in the next"""
+    agent = FlakyAgent()
+    monkeypatch.setattr(langgraph_workflow, "_get_combined_agent", lambda: agent)
+
+    async with analysis_workflow() as workflow:
+        first = await run_property_analysis(workflow, "2512345")
+    async with analysis_workflow() as workflow:
+        second = await run_property_analysis(workflow, "2512345")
+
+    assert second is first
+    assert agent.runs == 1
+    assert langgraph_workflow._cached_run.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_run_not_cached(checkpoint_db, monkeypatch):
+    agent = FlakyAgent(failures=1)
+    monkeypatch.setattr(langgraph_workflow, "_get_combined_agent", lambda: agent)
+
+    async with analysis_workflow() as workflow:
+        failed = await run_property_analysis(workflow, "2512345")
+
+    assert failed["errors"]
+    assert langgraph_workflow._cached_run.cache_info().currsize == 0
+
+
+def test_compute_envelope():
+    envelope = compute_envelope({"far": 0.35, "max_height_ft": 35}, 10_000)
+    assert envelope == {"max_buildable_sqft": 3500, "max_height": 35}
+
+
+def test_compute_envelope_without_height_limit():
+    assert compute_envelope({"far": 2.0}, 5_000)["max_height"] is None
+
+
+@pytest.mark.asyncio
+async def test_envelope_fast_path_keeps_sun_analysis(monkeypatch):
+    """With FAR and lot area the envelope is computed, and only sun hours come from the agent"""
+    queries = []
+
+    class RecordingAgent:
+        async def run(self, query, deps=None):
+            queries.append(query)
+
+    monkeypatch.setattr(langgraph_workflow, "_get_agent", lambda: RecordingAgent())
+    zoning = PropertyData(
+        parcel_id="2512345",
+        lot_area_sqft=7500,
+        zoning_dims={"far": 0.35, "max_height_ft": 35},
+    )
+
+    update = await envelope_agent_node({"parcel_id": "2512345", "property_data": zoning})
+
+    data = update["property_data"]
+    assert data.max_buildable_sqft == pytest.approx(2625)
+    assert data.max_height == 35
+    assert data.avg_sun_hours is not None
+    assert len(queries) == 1 and "sun" in queries[0]
+
+
+@pytest.mark.asyncio
+async def test_split_workflow_reaches_envelope_fast_path(checkpoint_db, monkeypatch):
+    """The zoning stage records the lot area the envelope fast path needs"""
+    monkeypatch.setattr(langgraph_workflow, "_get_agent", lambda: FlakyAgent())
+
+    async with analysis_workflow(split_agents=True) as workflow:
+        result = await run_property_analysis(workflow, "2512345")
+
+    data = result["property_data"]
+    assert result["errors"] == []
+    assert data.max_buildable_sqft == pytest.approx(data.lot_area_sqft * data.zoning_dims["far"])
+    assert data.avg_sun_hours is not None
+
+
+def test_fan_out_sends_only_branch_input():
+    state = {
+        "messages": ["history"] * 3,
+        "parcel_id": "2512345",
+        "property_data": PropertyData(parcel_id="2512345"),
+        "errors": [],
+    }
+
+    sends = langgraph_workflow.fan_out_phase1(state) + langgraph_workflow.fan_out_phase2(state)
+
+    assert [s.node for s in sends] == ["zoning", "permit", "valuation", "envelope"]
+    assert all(s.arg.keys() == {"parcel_id", "property_data"} for s in sends)
+
+
+@pytest.mark.asyncio
+async def test_combined_analysis_computes_envelope(monkeypatch):
+    class Agent:
+        async def run(self, query, deps=None):
+            return SimpleNamespace(data=FullAnalysis(
+                lot_area_sqft=10_000,
+                zoning_dims={"far": 0.5, "max_height_ft": 40},
+                max_buildable_sqft=1234,  # model's guess, overridden
+            ))
+
+    monkeypatch.setattr(langgraph_workflow, "_get_combined_agent", lambda: Agent())
+
+    update = await langgraph_workflow.combined_analysis_node({"parcel_id": "2512345"})
+
+    data = update["property_data"]
+    assert data.max_buildable_sqft == 5000
+    assert data.max_height == 40
+    assert data.envelope_generated
+
+
+# ----------------------------------------------------------------------------
+# Reducers
+# ----------------------------------------------------------------------------
+
+def test_merge_property_data_keeps_fields_set_by_each_agent():
+    left = PropertyData.model_construct(parcel_id="1", zoning_district="RS-10", arv=325000)
+    right = PropertyData.model_construct(parcel_id="1", permit_risk_score=15)
+
+    merged = merge_property_data(left, right)
+
+    assert merged.zoning_district == "RS-10"
+    assert merged.arv == 325000
+    assert merged.permit_risk_score == 15
+
+
+def test_merge_property_data_ignores_unset_defaults():
+    """An agent's untouched defaults don't overwrite another agent's values"""
+    left = PropertyData.model_construct(parcel_id="1", permit_risk_score=40, open_violations=[{"id": 1}])
+    right = PropertyData.model_construct(parcel_id="1", arv=325000)
+
+    merged = merge_property_data(left, right)
+
+    assert merged.permit_risk_score == 40
+    assert merged.open_violations == [{"id": 1}]
+
+
+def test_merge_completed_is_ordered_set_union():
+    assert merge_completed(["zoning", "permit"], ["permit", "valuation"]) == ["zoning", "permit", "valuation"]
+    assert merge_completed([], []) == []
+
+
+# ----------------------------------------------------------------------------
+# Synthesizer
+# ----------------------------------------------------------------------------
+
+def _synth_state(errors, completed=("zoning", "valuation", "permit", "envelope")):
+    return {
+        "property_data": PropertyData(parcel_id="2512345", arv=325000, max_bid=165000),
+        "errors": list(errors),
+        "completed_agents": list(completed),
+        "timestamp": "2026-02-01T00:00:00",
+    }
+
+
+@pytest.mark.asyncio
+async def test_synthesizer_full_report_below_failure_threshold():
+    errors = [f"agent {i} error" for i in range(FAILED_RUN_ERRORS - 1)]
+
+    report = (await synthesizer_node(_synth_state(errors)))["final_report"]
+
+    assert "## Valuation Summary" in report
+    assert "## Errors" in report
+    assert "FAILED" not in report
+
+
+@pytest.mark.asyncio
+async def test_synthesizer_failed_report_at_threshold():
+    errors = [f"agent {i} error" for i in range(FAILED_RUN_ERRORS)]
+
+    report = (await synthesizer_node(_synth_state(errors)))["final_report"]
+
+    assert "FAILED" in report
+    assert "Analysis failed for 2512345: agent 0 error" in report
+    assert "## Valuation Summary" not in report
+
+
+@pytest.mark.asyncio
+async def test_synthesizer_failed_report_when_nothing_completed():
+    report = (await synthesizer_node(_synth_state(["rate limited"], completed=())))["final_report"]
+
+    assert "FAILED" in report
+
+
+@pytest.mark.asyncio
+async def test_synthesizer_clean_run_has_no_errors_section():
+    report = (await synthesizer_node(_synth_state([])))["final_report"]
+
+    assert "BID" in report
+    assert "## Errors" not in report
@@ -0,0 +1,128 @@
+"""
+Unit tests for observability helpers (log emitter, metrics).
+
+Usage:
+    uv run pytest packages/agent/tests/test_observability.py -v
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import observability
+from observability import DurationStats, flush_logs
+
+
+def test_logs_emitted_after_flush():
+    """The emitter keeps draining events queued after an earlier flush"""
+    emitted = []
+
+    def emit(message, **attributes):
+        emitted.append((message, attributes))
+
+    observability._enqueue_log(emit, "first", n=1)
+    flush_logs()
+    observability._enqueue_log(emit, "second", n=2)
+    flush_logs()
+
+    assert emitted == [("first", {"n": 1}), ("second", {"n": 2})]
+
+
+class _RecordingSpan:
+    def __init__(self, **attributes):
+        self.attributes = attributes
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+@pytest.fixture
+def traced(monkeypatch):
+    """Pretend Logfire is initialised and capture what trace_agent_run records"""
+    records = []
+    monkeypatch.setattr(observability, "_initialized", True)
+    monkeypatch.setattr(observability, "_enqueue_log", lambda emit, message, **attrs: records.append(attrs))
+    return records
+
+
+# Metadata keys that are also trace attributes
+CLASHING_METADATA = {"duration_ms": 1, "success": "yes", "span_kind": "custom", "sample_rate": 0.5}
+
+
+def test_agent_run_metadata_unsampled(traced, monkeypatch):
+    monkeypatch.setattr(observability, "TRACE_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(observability, "SLOW_TRACE_MS", 0.0)  # record every run
+
+    with observability.trace_agent_run("analysis", "query", **CLASHING_METADATA):
+        pass
+
+    assert traced[0]["metadata"] == CLASHING_METADATA
+    assert traced[0]["agent_name"] == "analysis"
+
+
+def test_agent_run_metadata_sampled(traced, monkeypatch):
+    spans = []
+
+    def span(name, **attributes):
+        spans.append(_RecordingSpan(**attributes))
+        return spans[-1]
+
+    monkeypatch.setattr(observability, "TRACE_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(observability.logfire, "span", span)
+
+    with observability.trace_agent_run("analysis", "query", **CLASHING_METADATA):
+        pass
+
+    assert spans[0].attributes["metadata"] == CLASHING_METADATA
+    assert spans[0].attributes["success"] is True
+
+
+def test_local_trace_is_timed():
+    """Without Logfire nothing is exported, but durations are still real"""
+    with observability._LocalTrace(observability.SkillTrace(skill_name="zoning-analysis")) as trace:
+        time.sleep(0.01)
+
+    assert trace.duration_ms >= 10
+    assert trace.success and trace.ended_at is not None
+
+
+def test_local_trace_records_failure():
+    with pytest.raises(RuntimeError):
+        with observability._LocalTrace(observability.AgentTrace(agent_name="analysis", query="q")) as trace:
+            raise RuntimeError("rate limited")
+
+    assert not trace.success
+    assert trace.error == "rate limited"
+    assert trace.duration_ms > 0
+
+
+def test_duration_stats_matches_two_pass():
+    values = [12.0, 15.5, 9.25, 30.0, 11.0, 14.75]
+    stats = DurationStats()
+    for v in values:
+        stats.add(v)
+
+    mean = sum(values) / len(values)
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(mean)
+    assert stats.variance == pytest.approx(sum((v - mean) ** 2 for v in values) / (len(values) - 1))
+    assert (stats.min, stats.max) == (9.25, 30.0)
+
+
+def test_duration_stats_single_value():
+    stats = DurationStats()
+    stats.add(5.0)
+
+    assert stats.variance == 0.0
+    assert stats.mean == stats.min == stats.max == 5.0
@@ -0,0 +1,137 @@
+"""
+PDF export smoke tests for zonewise/scripts/pdf_generator.py.
+
+Usage:
+    uv run pytest packages/agent/tests/test_pdf_generator.py -v
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "zonewise" / "scripts"))
+from pdf_generator import ZoneWisePDFReport, format_currency
+
+
+def _scenario(name: str, sqft: float, recommended: bool = False) -> dict:
+    return {
+        "name": name,
+        "isRecommended": recommended,
+        "totalSqFt": sqft,
+        "stories": 4,
+        "components": [{"name": "Residential"}, {"name": "Retail"}],
+        "costs": {
+            "hardCosts": 4_200_000,
+            "softCosts": 800_000,
+            "landCost": 1_500_000,
+            "financingCosts": 350_000,
+            "contingency": 250_000,
+            "totalCost": 7_100_000,
+        },
+        "projections": {
+            "totalAssetValue": 9_800_000,
+            "developmentProfit": 2_700_000,
+            "roi": 38.0,
+            "irr": 21.5,
+            "equityMultiple": 1.85,
+            "cashOnCash": 9.2,
+        },
+        "riskLevel": "Medium",
+        "marketDemand": "High",
+        "revenueStreams": 2,
+    }
+
+
+@pytest.fixture
+def report_data():
+    scenarios = [
+        _scenario("Residential Focus", 42_000),
+        _scenario("Mixed-Use", 48_000, recommended=True),
+        _scenario("Hotel", 45_000),
+    ]
+    # Long enough to push tables onto later pages
+    findings = [f"Finding {i}: site supports additional density under current zoning" for i in range(40)]
+    return {
+        "property": {
+            "address": "123 Ocean Ave",
+            "city": "Melbourne",
+            "state": "FL",
+            "zipCode": "32901",
+            "parcelId": "2512345",
+            "county": "Brevard",
+        },
+        "site": {"lotAreaAcres": 0.5, "lotAreaSqFt": 21_780, "frontageLength": 120},
+        "zoning": {"zoningCode": "C-2", "zoningDistrict": "General Commercial", "maxFAR": 2.0},
+        "developmentCapacity": {
+            "maxBuildingArea": 43_560,
+            "unusedDevelopmentRights": 30_000,
+            "farUtilizationRate": 31.0,
+            "maxBuildingHeightStories": 5,
+        },
+        "financialOpportunity": {"untappedDevelopmentPotential": 69.0},
+        "executiveSummary": {
+            "keyFindings": findings,
+            "opportunities": findings[:20],
+            "challenges": findings[:20],
+            "recommendation": "Pursue the mixed-use scenario.",
+        },
+        "scenarios": scenarios,
+        "recommendedScenario": scenarios[1],
+    }
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0, "$0"),
+    (999.4, "$999"),
+    (1_000, "$1K"),
+    (450_000, "$450K"),
+    (999_999.9999999999, "$1000K"),  # just below a tier: log10 rounds up to 6.0
+    (1_000_000, "$1.0M"),
+    (7_100_000, "$7.1M"),
+    (999_999_999.9999999, "$1000.0M"),
+    (1_000_000_000, "$1.0B"),
+    (2.5e12, "$2500.0B"),
+    (-2_000, "$-2000"),
+])
+def test_format_currency(value, expected):
+    assert format_currency(value) == expected
+
+
+@pytest.mark.parametrize("fast_tables", [False, True])
+def test_generate_buffer_twice(report_data, fast_tables):
+    """A report instance can be rendered more than once"""
+    report = ZoneWisePDFReport(report_data, fast_tables=fast_tables)
+
+    first = report.generate_buffer()
+    second = report.generate_buffer()
+
+    assert first.startswith(b"%PDF")
+    assert second.startswith(b"%PDF")
+    assert len(second) == pytest.approx(len(first), rel=0.05)
+
+
+def test_generate_stream_after_buffer(report_data, tmp_path):
+    """Streaming after an in-memory build lays the report out again from scratch"""
+    report = ZoneWisePDFReport(report_data, fast_tables=True)
+    report.generate_buffer()
+
+    out = tmp_path / "report.pdf"
+    with open(out, "wb") as f:
+        report.generate_stream(f)
+
+    assert out.read_bytes().startswith(b"%PDF")
+
+
+def test_bullets_build_new_paragraphs(report_data):
+    """Recurring bullet lists share markup, never Paragraph instances"""
+    items = report_data["executiveSummary"]["opportunities"]
+    first = ZoneWisePDFReport(report_data)._bullets(items, "Highlight")
+    second = ZoneWisePDFReport(report_data)._bullets(items, "Highlight")
+
+    assert first[0] is not second[0]
+    assert first[0].text == second[0].text
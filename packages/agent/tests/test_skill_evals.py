@@ -18,12 +18,14 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import functools
+import os
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Sequence
 from pathlib import Path
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr, model_validator
 from pydantic_ai import Agent
 from pydantic_ai.models.test import TestModel
 
@@ -32,6 +34,12 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from zonewise_agent import create_agent, AgentDependencies, load_manifest
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # ============================================================================
 # Eval Data Models
 # ============================================================================
@@ -44,9 +52,17 @@ class SkillEvalCase(BaseModel):
     forbidden_skills: list[str] = []  # Skills that should NOT be loaded
     expected_in_response: list[str] = []  # Keywords expected in response
     description: str = ""
+    _expected_in_response_folded: list[str] = PrivateAttr(default_factory=list)
+    
+    @model_validator(mode="after")
+    def _fold_keywords(self) -> SkillEvalCase:
+        # Case-fold once here so run_eval never re-lowercases keywords
+        self._expected_in_response_folded = [kw.casefold() for kw in self.expected_in_response]
+        return self
 
-class SkillEvalResult(BaseModel):
-    """Result of an evaluation"""
+@dataclass(slots=True)
+class SkillEvalResult:
+    """Result of an evaluation (plain dataclass: built per case, never validated)"""
     case_name: str
     passed: bool
     skills_loaded: list[str]
@@ -165,10 +181,73 @@ SKILL_EVAL_CASES: list[SkillEvalCase] = [
     ),
 ]
 
+@dataclass
+class EvalCases:
+    """Column-oriented (struct-of-arrays) view of eval cases for the sweep loop"""
+    names: list[str]
+    queries: list[str]
+    expected: list[tuple[str, ...]]
+    forbidden: list[tuple[str, ...]]
+    kw_spans: list[tuple[int, int]]  # [start, end) into kw_table per case
+    kw_table: tuple[str, ...]  # Every case's expected_in_response, concatenated
+    kw_folded: tuple[str, ...]  # kw_table, case-folded
+    
+    @classmethod
+    def from_cases(cls, cases: Sequence[SkillEvalCase]) -> EvalCases:
+        kw_table: list[str] = []
+        kw_folded: list[str] = []
+        kw_spans: list[tuple[int, int]] = []
+        for case in cases:
+            start = len(kw_table)
+            kw_table.extend(case.expected_in_response)
+            kw_folded.extend(case._expected_in_response_folded)
+            kw_spans.append((start, len(kw_table)))
+        
+        return cls(
+            names=[c.name for c in cases],
+            queries=[c.query for c in cases],
+            expected=[tuple(c.expected_skills) for c in cases],
+            forbidden=[tuple(c.forbidden_skills) for c in cases],
+            kw_spans=kw_spans,
+            kw_table=tuple(kw_table),
+            kw_folded=tuple(kw_folded),
+        )
+    
+    def keywords(self, i: int) -> tuple[str, ...]:
+        start, end = self.kw_spans[i]
+        return self.kw_table[start:end]
+    
+    def keywords_folded(self, i: int) -> tuple[str, ...]:
+        start, end = self.kw_spans[i]
+        return self.kw_folded[start:end]
+    
+    def __len__(self) -> int:
+        return len(self.names)
+
+EVAL_TABLE = EvalCases.from_cases(SKILL_EVAL_CASES)
+
 # ============================================================================
 # Evaluation Runner
 # ============================================================================
 
+@functools.lru_cache(maxsize=None)
+def _keyword_automaton(keywords: tuple[str, ...], folded: tuple[str, ...]) -> Any:
+    """Aho-Corasick automaton over case-folded keywords, built once per case"""
+    automaton = ahocorasick.Automaton()
+    for kw, fold in zip(keywords, folded):
+        automaton.add_word(fold, kw)
+    automaton.make_automaton()
+    return automaton
+
+def match_keywords(response: str, keywords: Sequence[str], folded: Sequence[str]) -> set[str]:
+    """Keywords whose folded form occurs in an already-casefolded response"""
+    if not keywords:
+        return set()
+    if AHOCORASICK_AVAILABLE:
+        automaton = _keyword_automaton(tuple(keywords), tuple(folded))
+        return {kw for _, kw in automaton.iter(response)}
+    return {kw for kw, fold in zip(keywords, folded) if fold in response}
+
 class SkillEvaluator:
     """Evaluates agent skill loading behavior"""
     
@@ -176,29 +255,68 @@ class SkillEvaluator:
         self.agent = agent
         self.deps = deps
     
+    def _case_deps(self) -> AgentDependencies:
+        """Fresh per-case deps sharing the evaluator's parsed manifest"""
+        if self.deps.manifest is None:
+            self.deps.manifest = load_manifest(self.deps.skills_path)
+        return AgentDependencies(skills_path=self.deps.skills_path, manifest=self.deps.manifest)
+    
     async def run_eval(self, case: SkillEvalCase) -> SkillEvalResult:
         """Run a single evaluation case"""
-        # Reset loaded skills
-        self.deps.loaded_skills = {}
-        self.deps.loaded_references = {}
+        return await self._evaluate(
+            case.name,
+            case.query,
+            case.expected_skills,
+            case.forbidden_skills,
+            case.expected_in_response,
+            case._expected_in_response_folded,
+        )
+    
+    async def run_eval_at(self, i: int, table: EvalCases = EVAL_TABLE) -> SkillEvalResult:
+        """Run the i-th case straight from the column-oriented table"""
+        return await self._evaluate(
+            table.names[i],
+            table.queries[i],
+            table.expected[i],
+            table.forbidden[i],
+            table.keywords(i),
+            table.keywords_folded(i),
+        )
+    
+    async def _evaluate(
+        self,
+        name: str,
+        query: str,
+        expected_skills: Sequence[str],
+        forbidden_skills: Sequence[str],
+        expected_in_response: Sequence[str],
+        expected_folded: Sequence[str],
+    ) -> SkillEvalResult:
+        # Case-local deps: loaded_skills records only what this case loaded,
+        # while skill contents come from the process-wide cache in zonewise_agent
+        deps = self._case_deps()
         
         try:
             # Run the agent
-            result = await self.agent.run(case.query, deps=self.deps)
-            response = result.data.lower() if result.data else ""
+            result = await self.agent.run(query, deps=deps)
+            response = (result.data or "").casefold()
             
             # Check which skills were loaded
-            skills_loaded = list(self.deps.loaded_skills.keys())
+            skills_loaded = list(deps.loaded_skills.keys())
+            loaded = deps.loaded_skills.keys()  # Set-like view for O(1) membership
             
             # Check for missing expected skills
-            skills_missing = [s for s in case.expected_skills if s not in skills_loaded]
+            skills_missing = [s for s in expected_skills if s not in loaded]
             
             # Check for forbidden skills that were loaded
-            forbidden_loaded = [s for s in case.forbidden_skills if s in skills_loaded]
+            forbidden_loaded = [s for s in forbidden_skills if s in loaded]
             
-            # Check for expected keywords in response
-            response_keywords_found = [kw for kw in case.expected_in_response if kw.lower() in response]
-            response_keywords_missing = [kw for kw in case.expected_in_response if kw.lower() not in response]
+            # Check for expected keywords in response (single pass)
+            hits = match_keywords(response, expected_in_response, expected_folded)
+            response_keywords_found: list[str] = []
+            response_keywords_missing: list[str] = []
+            for kw in expected_in_response:
+                (response_keywords_found if kw in hits else response_keywords_missing).append(kw)
             
             # Determine if eval passed
             passed = (
@@ -208,7 +326,7 @@ class SkillEvaluator:
             )
             
             return SkillEvalResult(
-                case_name=case.name,
+                case_name=name,
                 passed=passed,
                 skills_loaded=skills_loaded,
                 skills_missing=skills_missing,
@@ -219,23 +337,25 @@ class SkillEvaluator:
             
         except Exception as e:
             return SkillEvalResult(
-                case_name=case.name,
+                case_name=name,
                 passed=False,
                 skills_loaded=[],
-                skills_missing=case.expected_skills,
+                skills_missing=list(expected_skills),
                 forbidden_loaded=[],
                 response_keywords_found=[],
-                response_keywords_missing=case.expected_in_response,
+                response_keywords_missing=list(expected_in_response),
                 error=str(e)
             )
     
     async def run_all_evals(self) -> list[SkillEvalResult]:
-        """Run all evaluation cases"""
-        results = []
-        for case in SKILL_EVAL_CASES:
-            result = await self.run_eval(case)
-            results.append(result)
-        return results
+        """Run all evaluation cases concurrently (bounded by ZW_EVAL_CONCURRENCY)"""
+        sem = asyncio.Semaphore(int(os.getenv("ZW_EVAL_CONCURRENCY", "6")))
+        
+        async def _run(i: int) -> SkillEvalResult:
+            async with sem:
+                return await self.run_eval_at(i)
+        
+        return list(await asyncio.gather(*(_run(i) for i in range(len(EVAL_TABLE)))))
     
     def print_report(self, results: list[SkillEvalResult]) -> None:
         """Print evaluation report"""
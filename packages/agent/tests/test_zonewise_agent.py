@@ -0,0 +1,116 @@
+"""
+Unit tests for the skill agent's loaders and router.
+
+Usage:
+    uv run pytest packages/agent/tests/test_zonewise_agent.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pydantic_ai")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import zonewise_agent
+from zonewise_agent import SkillRouter, SkillsManifest, load_manifest
+
+MANIFEST_YAML = """\
+version: "1.0.0"
+updated: "2026-02-01"
+total_skills: 2
+skills:
+  - name: zoning-analysis
+    description: Analyze zoning codes, setbacks and FAR.
+    path: skills/zoning-analysis/SKILL.md
+    category: zoning
+    priority: 1
+    tokens_estimate: 100
+  - name: sun-analysis
+    description: Sun and shadow hours for a building envelope.
+    path: skills/sun-analysis/SKILL.md
+    category: visualization
+    priority: 2
+    tokens_estimate: 100
+"""
+
+
+@pytest.fixture
+def skills_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(zonewise_agent, "MANIFEST_CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "skills"
+    path.mkdir()
+    (path / "skills-manifest.yaml").write_text(MANIFEST_YAML)
+    return path
+
+
+def test_manifest_cache_lives_outside_skills_dir(skills_path, tmp_path):
+    load_manifest(skills_path)
+
+    assert list(skills_path.iterdir()) == [skills_path / "skills-manifest.yaml"]
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+
+def test_manifest_cache_rebuilds_model(skills_path):
+    """A cached manifest is a fully initialised model, private attrs included"""
+    load_manifest(skills_path)
+    cached = load_manifest(skills_path)
+
+    assert isinstance(cached, SkillsManifest)
+    assert cached.get_skill("sun-analysis").priority == 2
+
+
+def test_manifest_cache_ignores_other_versions(skills_path):
+    manifest_path = skills_path / "skills-manifest.yaml"
+    cache_path = zonewise_agent._manifest_cache_path(manifest_path)
+    cache_path.parent.mkdir(parents=True)
+    stale = {"version": "0.0.1", "updated": "", "total_skills": 0, "skills": []}
+    cache_path.write_bytes(pickle.dumps(
+        (zonewise_agent.MANIFEST_CACHE_VERSION - 1, manifest_path.stat().st_mtime_ns, stale)
+    ))
+
+    assert load_manifest(skills_path).total_skills == 2
+
+
+def test_preload_scheduled_once_per_manifest_version(skills_path, monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(zonewise_agent, "schedule_skill_preload", lambda path, manifest: scheduled.append(path))
+    manifest_path = skills_path / "skills-manifest.yaml"
+
+    zonewise_agent.create_agent(model="test", skills_path=skills_path)
+    zonewise_agent.create_agent(model="test", skills_path=skills_path)
+    assert len(scheduled) == 1
+
+    stat = manifest_path.stat()
+    os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    zonewise_agent.create_agent(model="test", skills_path=skills_path)
+    assert len(scheduled) == 2
+
+
+@pytest.fixture
+def router(skills_path):
+    return SkillRouter(load_manifest(skills_path))
+
+
+def test_router_suggests_matching_skill(router):
+    assert router.suggest("What are the setbacks and FAR for this lot?") == ["zoning-analysis"]
+    assert router.suggest("How many shadow hours in winter?") == ["sun-analysis"]
+
+
+def test_router_ranks_by_keyword_hits(router):
+    # Two sun keywords outvote one zoning keyword
+    assert router.suggest("Sun and shadow impact of the new zoning") == ["sun-analysis", "zoning-analysis"]
+
+
+def test_router_matches_on_word_boundaries(router):
+    assert router.suggest("Tsunami evacuation zone") == []
+    assert router.suggest("Check the shadows") == ["sun-analysis"]
+
+
+def test_router_limit(router):
+    assert router.suggest("zoning setbacks sun shadow", limit=1) == ["zoning-analysis"]
@@ -22,14 +22,32 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
+import os
+import pickle
+import re
+import threading
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from pydantic_ai import Agent, RunContext
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml-backed, ~10x faster
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # ============================================================================
 # Data Models
 # ============================================================================
@@ -62,6 +80,22 @@ class SkillsManifest(BaseModel):
     updated: str
     total_skills: int
     skills: list[SkillMetadata]
+    _by_name: dict[str, SkillMetadata] = PrivateAttr(default_factory=dict)
+    _router: Any = PrivateAttr(default=None)
+    
+    def model_post_init(self, __context: Any) -> None:
+        self._by_name = {s.name: s for s in self.skills}
+    
+    def get_skill(self, skill_name: str) -> SkillMetadata | None:
+        """O(1) lookup of a skill by name"""
+        return self._by_name.get(skill_name)
+    
+    @property
+    def router(self) -> SkillRouter:
+        """Keyword router over this manifest, built on first use"""
+        if self._router is None:
+            self._router = SkillRouter(self)
+        return self._router
 
 # ============================================================================
 # Agent Dependencies
@@ -83,17 +117,54 @@ class AgentDependencies:
 # Skill Loader Functions
 # ============================================================================
 
+# Parsed-manifest cache, kept per user rather than in the (possibly shared or
+# read-only) skills directory
+MANIFEST_CACHE_DIR = Path(os.getenv(
+    "ZONEWISE_CACHE_DIR",
+    Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "zonewise",
+))
+# Bump when the cache file layout changes; older files are then re-parsed
+MANIFEST_CACHE_VERSION = 1
+
+def _manifest_cache_path(manifest_path: Path) -> Path:
+    """Cache file for one manifest, keyed on its absolute path"""
+    digest = hashlib.sha1(str(manifest_path.resolve()).encode()).hexdigest()[:16]
+    return MANIFEST_CACHE_DIR / f"skills-manifest-{digest}.pkl"
+
 def load_manifest(skills_path: Path) -> SkillsManifest:
-    """Load skills manifest from YAML file"""
+    """Load skills manifest from YAML file (via the parsed-YAML cache when fresh)"""
     manifest_path = skills_path / "skills-manifest.yaml"
     
     if not manifest_path.exists():
         raise FileNotFoundError(f"Skills manifest not found: {manifest_path}")
     
+    mtime_ns = manifest_path.stat().st_mtime_ns
+    cache_path = _manifest_cache_path(manifest_path)
+    
+    # Cache stores (version, source mtime, parsed YAML) as plain data, so the
+    # manifest is always rebuilt under the current model; any mismatch re-parses
+    try:
+        version, cached_mtime, data = pickle.loads(cache_path.read_bytes())
+        if version == MANIFEST_CACHE_VERSION and cached_mtime == mtime_ns:
+            return SkillsManifest(**data)
+    except Exception:
+        pass
+    
     with open(manifest_path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
     
-    return SkillsManifest(**data)
+    manifest = SkillsManifest(**data)
+    
+    # Write-then-rename so concurrent readers never see a torn file
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(pickle.dumps((MANIFEST_CACHE_VERSION, mtime_ns, data), protocol=5))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)  # Unwritable cache dir: just skip caching
+    
+    return manifest
 
 def get_skill_descriptions(manifest: SkillsManifest) -> str:
     """Generate Level 1 skill descriptions for system prompt"""
@@ -118,17 +189,30 @@ def parse_front_matter(content: str) -> tuple[dict[str, Any], str]:
         parts = content.split("---", 2)
         if len(parts) >= 3:
             try:
-                metadata = yaml.safe_load(parts[1])
+                metadata = yaml.load(parts[1], Loader=_YamlLoader)
                 body = parts[2].strip()
                 return metadata or {}, body
             except yaml.YAMLError:
                 pass
     return {}, content
 
+@functools.lru_cache(maxsize=256)
+def _parse_front_matter_cached(content: str) -> tuple[dict[str, Any], str]:
+    """parse_front_matter keyed on content; the returned dict is shared, don't mutate"""
+    return parse_front_matter(content)
+
+@functools.lru_cache(maxsize=256)
+def _read_text_cached(path_str: str, mtime_ns: int) -> str:
+    return Path(path_str).read_text()
+
+def _read_text(path: Path) -> str:
+    """Read a skill/reference file, cached until its mtime changes"""
+    return _read_text_cached(str(path), path.stat().st_mtime_ns)
+
 def load_skill_content(skills_path: Path, skill_name: str, manifest: SkillsManifest) -> LoadedSkill:
     """Load Level 2: Full skill content"""
     # Find skill in manifest
-    skill_meta = next((s for s in manifest.skills if s.name == skill_name), None)
+    skill_meta = manifest.get_skill(skill_name)
     if not skill_meta:
         raise ValueError(f"Skill not found: {skill_name}")
     
@@ -137,8 +221,12 @@ def load_skill_content(skills_path: Path, skill_name: str, manifest: SkillsManif
     if not skill_path.exists():
         raise FileNotFoundError(f"Skill file not found: {skill_path}")
     
-    content = skill_path.read_text()
-    front_matter, body = parse_front_matter(content)
+    return _parse_skill_cached(str(skill_path), skill_path.stat().st_mtime_ns, skill_name)
+
+@functools.lru_cache(maxsize=64)
+def _parse_skill_cached(path_str: str, mtime_ns: int, skill_name: str) -> LoadedSkill:
+    """Parsed SKILL.md shared read-only across agents; treat the result as immutable"""
+    front_matter, body = _parse_front_matter_cached(_read_text_cached(path_str, mtime_ns))
     
     return LoadedSkill(
         name=skill_name,
@@ -146,6 +234,32 @@ def load_skill_content(skills_path: Path, skill_name: str, manifest: SkillsManif
         front_matter=front_matter
     )
 
+PRELOAD_SKILLS = 8
+_PRELOAD_TASKS: set[asyncio.Task] = set()
+_PRELOAD_SCHEDULED: set[tuple[str, int]] = set()  # (skills path, manifest mtime_ns)
+
+def _preload_skills(skills_path: Path, manifest: SkillsManifest) -> None:
+    """Warm the skill cache with the top-priority skills (1 = highest)"""
+    for meta in sorted(manifest.skills, key=lambda s: s.priority)[:PRELOAD_SKILLS]:
+        try:
+            load_skill_content(skills_path, meta.name, manifest)
+        except (FileNotFoundError, ValueError):
+            pass
+
+def schedule_skill_preload(skills_path: Path, manifest: SkillsManifest) -> None:
+    """Preload skills in the background without blocking the caller"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        threading.Thread(
+            target=_preload_skills, args=(skills_path, manifest), daemon=True
+        ).start()
+        return
+    
+    task = loop.create_task(asyncio.to_thread(_preload_skills, skills_path, manifest))
+    _PRELOAD_TASKS.add(task)  # Hold a reference until done
+    task.add_done_callback(_PRELOAD_TASKS.discard)
+
 def load_reference_content(
     skills_path: Path, 
     skill_name: str, 
@@ -154,7 +268,7 @@ def load_reference_content(
 ) -> SkillReference:
     """Load Level 3: Reference document"""
     # Find skill in manifest
-    skill_meta = next((s for s in manifest.skills if s.name == skill_name), None)
+    skill_meta = manifest.get_skill(skill_name)
     if not skill_meta:
         raise ValueError(f"Skill not found: {skill_name}")
     
@@ -165,7 +279,7 @@ def load_reference_content(
     if not ref_path.exists():
         raise FileNotFoundError(f"Reference not found: {ref_path}")
     
-    content = ref_path.read_text()
+    content = _read_text(ref_path)
     
     return SkillReference(
         name=reference_name,
@@ -173,6 +287,103 @@ def load_reference_content(
         content=content
     )
 
+async def load_skills(deps: AgentDependencies, skill_names: list[str]) -> dict[str, LoadedSkill]:
+    """Load several skills concurrently, off the event loop, into deps.loaded_skills"""
+    if deps.manifest is None:
+        deps.manifest = await asyncio.to_thread(load_manifest, deps.skills_path)
+    
+    missing = [n for n in dict.fromkeys(skill_names) if n not in deps.loaded_skills]
+    skills = await asyncio.gather(*(
+        asyncio.to_thread(load_skill_content, deps.skills_path, name, deps.manifest)
+        for name in missing
+    ))
+    for skill in skills:
+        deps.loaded_skills[skill.name] = skill
+    
+    return {name: deps.loaded_skills[name] for name in skill_names}
+
+async def load_skill_references(deps: AgentDependencies, skill_name: str) -> list[SkillReference]:
+    """Load every reference listed for a skill concurrently into deps.loaded_references"""
+    if deps.manifest is None:
+        deps.manifest = await asyncio.to_thread(load_manifest, deps.skills_path)
+    
+    skill_meta = deps.manifest.get_skill(skill_name)
+    if not skill_meta:
+        raise ValueError(f"Skill not found: {skill_name}")
+    
+    refs = await asyncio.gather(*(
+        asyncio.to_thread(load_reference_content, deps.skills_path, skill_name, ref, deps.manifest)
+        for ref in skill_meta.references
+    ))
+    for ref in refs:
+        deps.loaded_references[f"{skill_name}:{ref.name}"] = ref
+    
+    return list(refs)
+
+# ============================================================================
+# Skill Routing
+# ============================================================================
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:\.[a-z0-9]+)*")
+
+# Filler and generic verbs that would nominate every skill
+_ROUTER_STOPWORDS = frozenset({
+    "and", "the", "for", "from", "with", "using", "into", "throughout",
+    "analyze", "calculate", "create", "generate", "estimate", "extract",
+    "identify", "search", "assess", "core", "custom", "data", "integration",
+    "patterns", "concepts", "information", "user",
+})
+
+def extract_skill_keywords(skill: SkillMetadata) -> set[str]:
+    """Routing keywords for a skill: name parts plus non-stopword description words"""
+    text = f"{skill.name.replace('-', ' ')} {skill.description}".casefold()
+    return {w for w in _WORD_RE.findall(text) if len(w) >= 3 and w not in _ROUTER_STOPWORDS}
+
+class SkillRouter:
+    """Single-pass keyword matcher that nominates candidate skills for a query"""
+    
+    def __init__(self, manifest: SkillsManifest):
+        self._skills_by_keyword: dict[str, list[str]] = {}
+        for skill in manifest.skills:
+            for kw in extract_skill_keywords(skill):
+                self._skills_by_keyword.setdefault(kw, []).append(skill.name)
+        self._order = {s.name: i for i, s in enumerate(manifest.skills)}
+        
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for kw in self._skills_by_keyword:
+                self._automaton.add_word(kw, kw)
+            self._automaton.make_automaton()
+    
+    def _matches(self, text: str) -> list[str]:
+        # Keywords must start on a word boundary ("shadows" hits "shadow", "sunday" doesn't hit "day")
+        if self._automaton is not None:
+            return [
+                kw for end, kw in self._automaton.iter(text)
+                if end - len(kw) < 0 or not text[end - len(kw)].isalnum()
+            ]
+        
+        hits = []
+        for kw in self._skills_by_keyword:
+            idx = text.find(kw)
+            while idx != -1:
+                if idx == 0 or not text[idx - 1].isalnum():
+                    hits.append(kw)
+                    break
+                idx = text.find(kw, idx + 1)
+        return hits
+    
+    def suggest(self, query: str, limit: int = 3) -> list[str]:
+        """Skill names ranked by keyword hits, ties broken by manifest order"""
+        votes = Counter(
+            name
+            for kw in set(self._matches(query.casefold()))
+            for name in self._skills_by_keyword[kw]
+        )
+        ranked = sorted(votes, key=lambda name: (-votes[name], self._order[name]))
+        return ranked[:limit]
+
 # ============================================================================
 # System Prompt
 # ============================================================================
@@ -193,9 +404,10 @@ You can help users with:
 ## Progressive Disclosure
 
 You have access to specialized skills. When you need detailed instructions:
-1. Use `load_skill` to load the full skill content
-2. If the skill references a document, use `read_reference` to load it
-3. Only load what you actually need
+1. Call `suggest_skills` with the user's query to get candidate skills
+2. Use `load_skill` to load the full skill content for the ones you need
+3. If the skill references a document, use `read_reference` to load it
+4. Only load what you actually need
 
 {skill_descriptions}
 
@@ -207,6 +419,17 @@ You have access to specialized skills. When you need detailed instructions:
 - For sun analysis, default location is Malabar, FL (28.004, -80.5687)
 """
 
+@functools.lru_cache(maxsize=8)
+def _load_manifest_cached(path_str: str, mtime_ns: int) -> SkillsManifest:
+    """Manifest keyed on file mtime so an edited manifest is re-read"""
+    return load_manifest(Path(path_str))
+
+@functools.lru_cache(maxsize=8)
+def _system_prompt_cached(path_str: str, mtime_ns: int) -> str:
+    """System prompt for a manifest version; see _load_manifest_cached"""
+    manifest = _load_manifest_cached(path_str, mtime_ns)
+    return SYSTEM_PROMPT.format(skill_descriptions=get_skill_descriptions(manifest))
+
 # ============================================================================
 # Tool Definitions
 # ============================================================================
@@ -232,16 +455,41 @@ async def load_skill_tool(ctx: RunContext[AgentDependencies], skill_name: str) -
     
     # Load manifest if not loaded
     if deps.manifest is None:
-        deps.manifest = load_manifest(deps.skills_path)
+        deps.manifest = await asyncio.to_thread(load_manifest, deps.skills_path)
     
     # Load skill
     try:
-        skill = load_skill_content(deps.skills_path, skill_name, deps.manifest)
+        skill = await asyncio.to_thread(
+            load_skill_content, deps.skills_path, skill_name, deps.manifest
+        )
         deps.loaded_skills[skill_name] = skill
         return f"# {skill_name} Skill\n\n{skill.content}"
     except (FileNotFoundError, ValueError) as e:
         return f"Error loading skill: {e}"
 
+async def suggest_skills_tool(ctx: RunContext[AgentDependencies], query: str) -> str:
+    """
+    Suggest which skills are relevant to a query.
+    
+    Cheap keyword match over the skill catalog; call it before load_skill.
+    
+    Args:
+        query: The user's request
+    
+    Returns:
+        Candidate skill names, best match first
+    """
+    deps = ctx.deps
+    
+    # Load manifest if not loaded
+    if deps.manifest is None:
+        deps.manifest = await asyncio.to_thread(load_manifest, deps.skills_path)
+    
+    names = deps.manifest.router.suggest(query)
+    if not names:
+        return "No matching skills; answer directly if no skill is needed."
+    return "Suggested skills: " + ", ".join(names)
+
 async def read_reference_tool(
     ctx: RunContext[AgentDependencies], 
     skill_name: str, 
@@ -269,11 +517,13 @@ async def read_reference_tool(
     
     # Load manifest if not loaded
     if deps.manifest is None:
-        deps.manifest = load_manifest(deps.skills_path)
+        deps.manifest = await asyncio.to_thread(load_manifest, deps.skills_path)
     
     # Load reference
     try:
-        ref = load_reference_content(deps.skills_path, skill_name, reference_name, deps.manifest)
+        ref = await asyncio.to_thread(
+            load_reference_content, deps.skills_path, skill_name, reference_name, deps.manifest
+        )
         deps.loaded_references[cache_key] = ref
         return f"# Reference: {reference_name}\n\n{ref.content}"
     except (FileNotFoundError, ValueError) as e:
@@ -285,14 +535,16 @@ async def read_reference_tool(
 
 def create_agent(
     model: str = "anthropic:claude-sonnet-4-20250514",
-    skills_path: str | Path = "./zonewise/skills"
-) -> Agent[AgentDependencies, str]:
+    skills_path: str | Path = "./zonewise/skills",
+    result_type: type[Any] = str
+) -> Agent[AgentDependencies, Any]:
     """
     Create a ZoneWise.AI agent with progressive disclosure skills.
     
     Args:
         model: LLM model to use (default: Claude Sonnet 4)
         skills_path: Path to skills directory
+        result_type: Output type (str, or a Pydantic model for structured output)
     
     Returns:
         Configured Pydantic AI agent
@@ -303,23 +555,31 @@ def create_agent(
         result = await agent.run("What zoning applies to this parcel?", deps=deps)
     """
     skills_path = Path(skills_path)
+    manifest_path = skills_path / "skills-manifest.yaml"
+    
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"Skills manifest not found: {manifest_path}")
     
-    # Load manifest for system prompt
-    manifest = load_manifest(skills_path)
-    skill_descriptions = get_skill_descriptions(manifest)
+    # Create system prompt (cached until the manifest changes on disk)
+    path_str, mtime_ns = str(skills_path.resolve()), manifest_path.stat().st_mtime_ns
+    system_prompt = _system_prompt_cached(path_str, mtime_ns)
     
-    # Create system prompt
-    system_prompt = SYSTEM_PROMPT.format(skill_descriptions=skill_descriptions)
+    # Warm the highest-priority skills so first use isn't a disk read; once
+    # per manifest version, not once per agent
+    if (path_str, mtime_ns) not in _PRELOAD_SCHEDULED:
+        _PRELOAD_SCHEDULED.add((path_str, mtime_ns))
+        schedule_skill_preload(skills_path, _load_manifest_cached(path_str, mtime_ns))
     
     # Create agent
     agent = Agent(
         model,
         system_prompt=system_prompt,
         deps_type=AgentDependencies,
-        result_type=str
+        result_type=result_type
     )
     
     # Register tools
+    agent.tool(suggest_skills_tool)
     agent.tool(load_skill_tool)
     agent.tool(read_reference_tool)
     
@@ -4,14 +4,32 @@ ZoneWise V2 - PDF Export Service (Python/ReportLab)
 Professional PDF generation for development analysis reports
 
 Usage:
-    python pdf_generator.py report.json output.pdf
+    python pdf_generator.py report.json output.pdf [--fast]
+    python pdf_generator.py --batch "reports/*.json" --out pdfs/ [--workers N] [--fast]
+
+--fast draws the fixed-layout tables directly on the canvas (FixedTable)
+instead of through the Platypus Table flowable. --batch renders every
+matching report in parallel worker processes, one <name>.pdf per input.
 """
 
+import argparse
+import glob
 import json
+import math
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence
+
+try:
+    import orjson  # Faster JSON parsing for large report files
+except ImportError:
+    orjson = None
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
@@ -20,37 +38,71 @@ from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, Image, KeepTogether
+    PageBreak, Image, KeepTogether, Flowable
 )
 from reportlab.pdfgen import canvas
 
-# Brand Colors
+# Brand Colors (pre-resolved; equivalent to colors.HexColor('#RRGGBB'))
+PRIMARY = colors.Color(0x1E / 255, 0x3A / 255, 0x5F / 255)      # #1E3A5F
+SECONDARY = colors.Color(0x2C / 255, 0x52 / 255, 0x82 / 255)    # #2C5282
+ACCENT = colors.Color(0x38 / 255, 0xA1 / 255, 0x69 / 255)       # #38A169
+WARNING = colors.Color(0xD6 / 255, 0x9E / 255, 0x2E / 255)      # #D69E2E
+DANGER = colors.Color(0xE5 / 255, 0x3E / 255, 0x3E / 255)       # #E53E3E
+LIGHT_GRAY = colors.Color(0xF7 / 255, 0xFA / 255, 0xFC / 255)   # #F7FAFC
+MEDIUM_GRAY = colors.Color(0xE2 / 255, 0xE8 / 255, 0xF0 / 255)  # #E2E8F0
+DARK_GRAY = colors.Color(0x4A / 255, 0x55 / 255, 0x68 / 255)    # #4A5568
+RECOMMENDATION_BG = colors.Color(0xE6 / 255, 0xFF / 255, 0xFA / 255)  # #E6FFFA
+
+# Name -> color, for callers that pick a brand color dynamically
 COLORS = {
-    'primary': colors.HexColor('#1E3A5F'),
-    'secondary': colors.HexColor('#2C5282'),
-    'accent': colors.HexColor('#38A169'),
-    'warning': colors.HexColor('#D69E2E'),
-    'danger': colors.HexColor('#E53E3E'),
-    'light_gray': colors.HexColor('#F7FAFC'),
-    'medium_gray': colors.HexColor('#E2E8F0'),
-    'dark_gray': colors.HexColor('#4A5568'),
+    'primary': PRIMARY,
+    'secondary': SECONDARY,
+    'accent': ACCENT,
+    'warning': WARNING,
+    'danger': DANGER,
+    'light_gray': LIGHT_GRAY,
+    'medium_gray': MEDIUM_GRAY,
+    'dark_gray': DARK_GRAY,
 }
 
+# Table column widths
+TITLE_METRIC_COLS = (2.5 * inch, 2.5 * inch)
+SNAPSHOT_COLS = (1.3 * inch, 1.5 * inch, 1.5 * inch, 1.7 * inch)
+SITE_COLS = (2 * inch, 4 * inch)
+FINANCIAL_COLS = (3 * inch, 2 * inch)
+SCENARIO_COL = 1.5 * inch  # Metric label column and each scenario column
+
+# Vertical gaps between blocks. Spacers are built per use: doc.build() marks
+# one it pushes to the next page (_postponed), which breaks later reuse.
+SPACE_SMALL = 0.15 * inch
+SPACE_MED = 0.2 * inch
+SPACE_LG = 0.3 * inch
+
+# A page break is a frame action that is never postponed, so one instance is shared
+PAGE_BREAK = PageBreak()
+
 
 def format_number(num: float) -> str:
     """Format number with commas"""
     return f"{num:,.0f}"
 
 
+# (divisor, suffix, decimals) indexed by thousands-exponent tier
+_CURRENCY_SCALES = (
+    (1, '', 0),
+    (1_000, 'K', 0),
+    (1_000_000, 'M', 1),
+    (1_000_000_000, 'B', 1),
+)
+
+
 def format_currency(num: float) -> str:
     """Format currency with appropriate suffix"""
-    if num >= 1_000_000_000:
-        return f"${num / 1_000_000_000:.1f}B"
-    if num >= 1_000_000:
-        return f"${num / 1_000_000:.1f}M"
-    if num >= 1_000:
-        return f"${num / 1_000:.0f}K"
-    return f"${num:.0f}"
+    tier = min(int(math.log10(num)) // 3, 3) if 1_000 <= num < math.inf else 0
+    if tier and num < _CURRENCY_SCALES[tier][0]:
+        tier -= 1  # log10 rounds up just below a power of ten (999999.9999999999 -> 6.0)
+    divisor, suffix, decimals = _CURRENCY_SCALES[tier]
+    return f"${num / divisor:.{decimals}f}{suffix}"
 
 
 def format_percent(num: float) -> str:
@@ -58,21 +110,234 @@ def format_percent(num: float) -> str:
     return f"{num:.1f}%"
 
 
+@lru_cache(maxsize=256)
+def _bullet_markup(items: tuple) -> str:
+    """Bullet texts as <br/>-joined markup (not Paragraphs: those keep layout state)"""
+    return '<br/>'.join(f"• {item}" for item in items)
+
+
+@lru_cache(maxsize=1)
+def _generated_stamp(minute: int) -> str:
+    return datetime.now().strftime('%B %d, %Y')
+
+
+def generated_date() -> str:
+    """Report generation date, re-formatted at most once a minute"""
+    return _generated_stamp(int(time.time() // 60))
+
+
+# TableStyle commands shared by every _create_table call; only the header
+# BACKGROUND (prepended per table) varies
+_BASE_TABLE_STYLE = (
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    # Alternate row colors (white, light gray) starting below the header
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 0.5, MEDIUM_GRAY),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+)
+
+# Row labels of the scenario comparison table, in _scenario_cells order
+COMPARISON_LABELS = (
+    'Metric', 'Total Area', 'Stories', 'Total Cost',
+    'Asset Value', 'Profit', 'IRR', 'Equity Multiple',
+)
+
+
+# Typed views of the report JSON (lib/types/development-analysis.ts), limited
+# to the fields the PDF reads. Parsed once per report instead of re-indexing
+# nested dicts in every section builder.
+
+@dataclass(slots=True)
+class DevelopmentCosts:
+    hard_costs: float
+    soft_costs: float
+    land_cost: float
+    financing_costs: float
+    contingency: float
+    total_cost: float
+    
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> 'DevelopmentCosts':
+        return cls(
+            hard_costs=d['hardCosts'],
+            soft_costs=d['softCosts'],
+            land_cost=d['landCost'],
+            financing_costs=d['financingCosts'],
+            contingency=d['contingency'],
+            total_cost=d['totalCost'],
+        )
+
+
+@dataclass(slots=True)
+class FinancialProjections:
+    total_asset_value: float
+    development_profit: float
+    roi: float
+    irr: float
+    equity_multiple: float
+    cash_on_cash: float
+    
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> 'FinancialProjections':
+        return cls(
+            total_asset_value=d['totalAssetValue'],
+            development_profit=d['developmentProfit'],
+            roi=d['roi'],
+            irr=d['irr'],
+            equity_multiple=d['equityMultiple'],
+            cash_on_cash=d['cashOnCash'],
+        )
+
+
+@dataclass(slots=True)
+class DevelopmentScenario:
+    name: str
+    is_recommended: bool
+    total_sqft: float
+    stories: int
+    components: List[str]  # Component names
+    costs: DevelopmentCosts
+    projections: FinancialProjections
+    risk_level: str
+    market_demand: str
+    revenue_streams: int
+    
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> 'DevelopmentScenario':
+        return cls(
+            name=d['name'],
+            is_recommended=bool(d.get('isRecommended')),
+            total_sqft=d['totalSqFt'],
+            stories=d['stories'],
+            components=[c['name'] for c in d['components']],
+            costs=DevelopmentCosts.from_dict(d['costs']),
+            projections=FinancialProjections.from_dict(d['projections']),
+            risk_level=d['riskLevel'],
+            market_demand=d['marketDemand'],
+            revenue_streams=d['revenueStreams'],
+        )
+
+
+def _scenario_cells(s: DevelopmentScenario) -> tuple:
+    """One scenario's column of the comparison table (header first)"""
+    proj = s.projections
+    return (
+        s.name + (' ★' if s.is_recommended else ''),
+        f"{format_number(s.total_sqft)} ft²",
+        str(s.stories),
+        format_currency(s.costs.total_cost),
+        format_currency(proj.total_asset_value),
+        format_currency(proj.development_profit),
+        format_percent(proj.irr),
+        f"{proj.equity_multiple:.2f}x",
+    )
+
+
+class FixedTable(Flowable):
+    """
+    Table drawn straight onto the canvas with fixed row heights.
+    
+    Matches _create_table's look but skips Table's per-cell wrap/measure pass.
+    Cells must be short single-line strings (true of every table in this
+    report); the table is never split across pages.
+    """
+    
+    PADDING = 8
+    V_PADDING = 6
+    HEADER_FONT = ('Helvetica-Bold', 10)
+    BODY_FONT = ('Helvetica', 9)
+    # Font leading (1.2 x size) plus top/bottom padding, as Table computes it
+    HEADER_HEIGHT = 10 * 1.2 + 2 * V_PADDING
+    ROW_HEIGHT = 9 * 1.2 + 2 * V_PADDING
+    
+    def __init__(self, data: List[List[str]], col_widths: Sequence[float],
+                 header_color: colors.Color = PRIMARY):
+        super().__init__()
+        self.data = data
+        self.col_widths = tuple(col_widths)
+        self.header_color = header_color
+        self.hAlign = 'CENTER'  # Table's default
+        self.width = sum(self.col_widths)
+        self.height = self.HEADER_HEIGHT + self.ROW_HEIGHT * (len(data) - 1)
+    
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+    
+    def draw(self):
+        c = self.canv
+        x_edges = [0.0]
+        for w in self.col_widths:
+            x_edges.append(x_edges[-1] + w)
+        
+        y_edges = [self.height]
+        y = self.height
+        for i, row in enumerate(self.data):
+            header = i == 0
+            h = self.HEADER_HEIGHT if header else self.ROW_HEIGHT
+            y -= h
+            y_edges.append(y)
+            
+            fill = self.header_color if header else (colors.white if i % 2 else LIGHT_GRAY)
+            c.setFillColor(fill)
+            c.rect(0, y, self.width, h, stroke=0, fill=1)
+            
+            font, size = self.HEADER_FONT if header else self.BODY_FONT
+            c.setFont(font, size)
+            c.setFillColor(colors.white if header else colors.black)
+            baseline = y + self.V_PADDING + 0.2 * size * 1.2  # Vertically centred
+            for x, cell in zip(x_edges, row):
+                c.drawString(x + self.PADDING, baseline, str(cell))
+        
+        c.setStrokeColor(MEDIUM_GRAY)
+        c.setLineWidth(0.5)
+        c.grid(x_edges, y_edges)
+
+
 class ZoneWisePDFReport:
     """Generate professional PDF reports for development analysis"""
     
-    def __init__(self, report_data: Dict[str, Any]):
+    # SimpleDocTemplate settings shared by generate() and generate_buffer()
+    _DOC_KW = {
+        'pagesize': letter,
+        'rightMargin': 0.75 * inch,
+        'leftMargin': 0.75 * inch,
+        'topMargin': 0.75 * inch,
+        'bottomMargin': 0.75 * inch,
+    }
+    
+    def __init__(self, report_data: Dict[str, Any], fast_tables: bool = False):
         self.data = report_data
+        prop = report_data['property']
+        self._city_line = f"{prop['city']}, {prop['state']} {prop.get('zipCode', '')}"
+        self.scenarios = [DevelopmentScenario.from_dict(s) for s in report_data['scenarios']]
+        recommended = report_data.get('recommendedScenario')
+        self.recommended = DevelopmentScenario.from_dict(recommended) if recommended else None
+        self.fast_tables = fast_tables  # Draw tables directly (FixedTable) instead of Table
         self.styles = getSampleStyleSheet()
         self._setup_styles()
     
     def _setup_styles(self):
         """Configure custom styles"""
+        # The sample sheet already defines these; add() refuses to redefine a name
+        for name in ('Title', 'BodyText'):
+            del self.styles.byName[name]
+        
         self.styles.add(ParagraphStyle(
             name='Title',
             parent=self.styles['Heading1'],
             fontSize=24,
-            textColor=COLORS['primary'],
+            textColor=PRIMARY,
             spaceAfter=20,
             alignment=TA_CENTER
         ))
@@ -81,7 +346,7 @@ class ZoneWisePDFReport:
             name='SectionHeader',
             parent=self.styles['Heading1'],
             fontSize=16,
-            textColor=COLORS['primary'],
+            textColor=PRIMARY,
             spaceBefore=20,
             spaceAfter=10
         ))
@@ -90,7 +355,7 @@ class ZoneWisePDFReport:
             name='SubHeader',
             parent=self.styles['Heading2'],
             fontSize=12,
-            textColor=COLORS['secondary'],
+            textColor=SECONDARY,
             spaceBefore=15,
             spaceAfter=8
         ))
@@ -107,7 +372,7 @@ class ZoneWisePDFReport:
             name='Highlight',
             parent=self.styles['Normal'],
             fontSize=10,
-            textColor=COLORS['accent'],
+            textColor=ACCENT,
             fontName='Helvetica-Bold'
         ))
         
@@ -115,42 +380,66 @@ class ZoneWisePDFReport:
             name='Footer',
             parent=self.styles['Normal'],
             fontSize=8,
-            textColor=COLORS['dark_gray'],
+            textColor=DARK_GRAY,
             alignment=TA_CENTER
         ))
-    
-    def _create_table(self, data: List[List[str]], col_widths: List[float] = None,
-                      header_color: colors.Color = None) -> Table:
-        """Create formatted table"""
-        table = Table(data, colWidths=col_widths)
         
-        style = [
-            ('BACKGROUND', (0, 0), (-1, 0), header_color or COLORS['primary']),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 0.5, COLORS['medium_gray']),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-        ]
+        # Title page
+        self.styles.add(ParagraphStyle(
+            name='Address',
+            fontSize=20,
+            textColor=PRIMARY,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        ))
+        
+        self.styles.add(ParagraphStyle(
+            name='City',
+            fontSize=14,
+            textColor=DARK_GRAY,
+            alignment=TA_CENTER
+        ))
+        
+        self.styles.add(ParagraphStyle(
+            name='Subtitle',
+            fontSize=11,
+            textColor=SECONDARY,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Oblique'
+        ))
+        
+        # Executive summary / financial section
+        self.styles.add(ParagraphStyle(
+            name='Recommendation',
+            parent=self.styles['BodyText'],
+            backColor=RECOMMENDATION_BG,
+            borderPadding=10
+        ))
         
-        # Alternate row colors
-        for i in range(1, len(data)):
-            if i % 2 == 0:
-                style.append(('BACKGROUND', (0, i), (-1, i), COLORS['light_gray']))
+        self.styles.add(ParagraphStyle(
+            name='ScenarioNote',
+            fontSize=10,
+            textColor=DARK_GRAY,
+            fontName='Helvetica-Oblique'
+        ))
+    
+    def _create_table(self, data: List[List[str]], col_widths: Sequence[float] = None,
+                      header_color: colors.Color = None) -> Flowable:
+        """Create formatted table"""
+        if self.fast_tables and col_widths is not None:
+            return FixedTable(data, col_widths, header_color or PRIMARY)
         
-        table.setStyle(TableStyle(style))
+        table = Table(data, colWidths=col_widths)
+        table.setStyle(TableStyle([('BACKGROUND', (0, 0), (-1, 0), header_color or PRIMARY), *_BASE_TABLE_STYLE]))
         return table
     
+    def _bullets(self, items: Sequence[str], style_name: str) -> List:
+        """A bullet list as one <br/>-separated Paragraph; markup is reused for recurring lists"""
+        if not items:
+            return []
+        
+        return [Paragraph(_bullet_markup(tuple(items)), self.styles[style_name])]
+    
     def _build_title_page(self) -> List:
         """Build title page elements"""
         prop = self.data['property']
@@ -159,28 +448,11 @@ class ZoneWisePDFReport:
         elements = [
             Spacer(1, 2 * inch),
             Paragraph('DEVELOPMENT ANALYSIS REPORT', self.styles['Title']),
-            Spacer(1, 0.3 * inch),
-            Paragraph(prop['address'], ParagraphStyle(
-                name='Address',
-                fontSize=20,
-                textColor=COLORS['primary'],
-                alignment=TA_CENTER,
-                fontName='Helvetica-Bold'
-            )),
-            Paragraph(f"{prop['city']}, {prop['state']} {prop.get('zipCode', '')}", ParagraphStyle(
-                name='City',
-                fontSize=14,
-                textColor=COLORS['dark_gray'],
-                alignment=TA_CENTER
-            )),
+            Spacer(1, SPACE_LG),
+            Paragraph(prop['address'], self.styles['Address']),
+            Paragraph(self._city_line, self.styles['City']),
             Spacer(1, 0.5 * inch),
-            Paragraph('63+ KPIs | 3 Development Scenarios | Financial Analysis', ParagraphStyle(
-                name='Subtitle',
-                fontSize=11,
-                textColor=COLORS['secondary'],
-                alignment=TA_CENTER,
-                fontName='Helvetica-Oblique'
-            )),
+            Paragraph('63+ KPIs | 3 Development Scenarios | Financial Analysis', self.styles['Subtitle']),
             Spacer(1, 1 * inch),
         ]
         
@@ -193,14 +465,14 @@ class ZoneWisePDFReport:
             ['Max Stories', str(dc['maxBuildingHeightStories'])],
         ]
         
-        metrics_table = self._create_table(metrics_data, [2.5 * inch, 2.5 * inch], COLORS['accent'])
+        metrics_table = self._create_table(metrics_data, TITLE_METRIC_COLS, ACCENT)
         elements.append(metrics_table)
         
         elements.extend([
             Spacer(1, 1.5 * inch),
-            Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", self.styles['Footer']),
+            Paragraph(f"Generated: {generated_date()}", self.styles['Footer']),
             Paragraph('Powered by ZoneWise V2 | © 2026 Everest Capital USA', self.styles['Footer']),
-            PageBreak()
+            PAGE_BREAK
         ])
         
         return elements
@@ -224,34 +496,26 @@ class ZoneWisePDFReport:
             ['Residential', 'N/A', f"{format_number(dc.get('maxResidentialUnits', 0))} units", f"{format_number(fo.get('residentialPotentialUnits', 0))} potential"],
             ['Hotel', 'N/A', f"{format_number(dc.get('maxLodgingRooms', 0))} rooms", f"{format_number(fo.get('hotelPotentialRooms', 0))} potential"],
         ]
-        elements.append(self._create_table(snapshot_data, [1.3*inch, 1.5*inch, 1.5*inch, 1.7*inch]))
-        elements.append(Spacer(1, 0.3 * inch))
+        elements.append(self._create_table(snapshot_data, SNAPSHOT_COLS))
+        elements.append(Spacer(1, SPACE_LG))
         
         # Key Findings
         elements.append(Paragraph('Key Findings', self.styles['SubHeader']))
-        for finding in summary['keyFindings']:
-            elements.append(Paragraph(f"• {finding}", self.styles['BodyText']))
+        elements.extend(self._bullets(summary['keyFindings'], 'BodyText'))
         
         # Opportunities
         elements.append(Paragraph('Opportunities', self.styles['SubHeader']))
-        for opp in summary['opportunities']:
-            elements.append(Paragraph(f"• {opp}", self.styles['Highlight']))
+        elements.extend(self._bullets(summary['opportunities'], 'Highlight'))
         
         # Challenges
         elements.append(Paragraph('Challenges', self.styles['SubHeader']))
-        for challenge in summary['challenges']:
-            elements.append(Paragraph(f"• {challenge}", self.styles['BodyText']))
+        elements.extend(self._bullets(summary['challenges'], 'BodyText'))
         
         # Recommendation
         elements.append(Paragraph('Recommendation', self.styles['SubHeader']))
-        elements.append(Paragraph(summary['recommendation'], ParagraphStyle(
-            name='Recommendation',
-            parent=self.styles['BodyText'],
-            backColor=colors.HexColor('#E6FFFA'),
-            borderPadding=10
-        )))
+        elements.append(Paragraph(summary['recommendation'], self.styles['Recommendation']))
         
-        elements.append(PageBreak())
+        elements.append(PAGE_BREAK)
         return elements
     
     def _build_property_overview(self) -> List:
@@ -268,7 +532,7 @@ class ZoneWisePDFReport:
         site_data = [
             ['Property', 'Value'],
             ['Address', prop['address']],
-            ['City/State', f"{prop['city']}, {prop['state']} {prop.get('zipCode', '')}"],
+            ['City/State', self._city_line],
             ['Parcel ID', prop.get('parcelId', 'N/A')],
             ['County', prop.get('county', 'N/A')],
             ['Lot Area', f"{site['lotAreaAcres']:.2f} acres ({format_number(site['lotAreaSqFt'])} ft²)"],
@@ -276,8 +540,8 @@ class ZoneWisePDFReport:
             ['Frontage', f"{format_number(site.get('frontageLength', 0))} ft" if site.get('frontageLength') else 'N/A'],
             ['Current Use', site.get('currentLandUse', 'N/A')],
         ]
-        elements.append(self._create_table(site_data, [2*inch, 4*inch], COLORS['secondary']))
-        elements.append(Spacer(1, 0.3 * inch))
+        elements.append(self._create_table(site_data, SITE_COLS, SECONDARY))
+        elements.append(Spacer(1, SPACE_LG))
         
         elements.append(Paragraph('Zoning Profile', self.styles['SubHeader']))
         zoning_data = [
@@ -292,160 +556,184 @@ class ZoneWisePDFReport:
             ['TOD Status', zoning.get('todStatus', 'N/A')],
             ['Live Local Act', 'Applicable' if zoning.get('liveLocalApplicability') else 'Not Applicable'],
         ]
-        elements.append(self._create_table(zoning_data, [2*inch, 4*inch], COLORS['secondary']))
+        elements.append(self._create_table(zoning_data, SITE_COLS, SECONDARY))
         
-        elements.append(PageBreak())
+        elements.append(PAGE_BREAK)
         return elements
     
     def _build_scenarios_section(self) -> List:
         """Build development scenarios section"""
-        scenarios = self.data['scenarios']
+        scenarios = self.scenarios
         
         elements = [
             Paragraph('Development Scenarios', self.styles['SectionHeader']),
             Paragraph('Scenario Comparison', self.styles['SubHeader']),
         ]
         
-        # Comparison table
-        headers = ['Metric'] + [s['name'] + (' ★' if s.get('isRecommended') else '') for s in scenarios]
-        comparison_data = [
-            headers,
-            ['Total Area'] + [f"{format_number(s['totalSqFt'])} ft²" for s in scenarios],
-            ['Stories'] + [str(s['stories']) for s in scenarios],
-            ['Total Cost'] + [format_currency(s['costs']['totalCost']) for s in scenarios],
-            ['Asset Value'] + [format_currency(s['projections']['totalAssetValue']) for s in scenarios],
-            ['Profit'] + [format_currency(s['projections']['developmentProfit']) for s in scenarios],
-            ['IRR'] + [format_percent(s['projections']['irr']) for s in scenarios],
-            ['Equity Multiple'] + [f"{s['projections']['equityMultiple']:.2f}x" for s in scenarios],
-        ]
+        # Comparison table: format each scenario's column once, then transpose
+        columns = [_scenario_cells(s) for s in scenarios]
+        comparison_data = [[label, *cells] for label, *cells in zip(COMPARISON_LABELS, *columns)]
         
-        col_widths = [1.5*inch] + [1.5*inch] * len(scenarios)
+        col_widths = (SCENARIO_COL,) * (len(scenarios) + 1)
         elements.append(self._create_table(comparison_data, col_widths))
-        elements.append(Spacer(1, 0.3 * inch))
+        elements.append(Spacer(1, SPACE_LG))
         
         # Individual scenario details
         for scenario in scenarios:
-            rec = ' ★ RECOMMENDED' if scenario.get('isRecommended') else ''
-            elements.append(Paragraph(f"{scenario['name']}{rec}", self.styles['SubHeader']))
+            rec = ' ★ RECOMMENDED' if scenario.is_recommended else ''
+            elements.append(Paragraph(f"{scenario.name}{rec}", self.styles['SubHeader']))
             
-            components = ', '.join([c['name'] for c in scenario['components']])
+            components = ', '.join(scenario.components)
             elements.append(Paragraph(f"Components: {components}", self.styles['BodyText']))
             elements.append(Paragraph(
-                f"Risk: {scenario['riskLevel']} | Demand: {scenario['marketDemand']} | {scenario['revenueStreams']} revenue streams",
+                f"Risk: {scenario.risk_level} | Demand: {scenario.market_demand} | {scenario.revenue_streams} revenue streams",
                 self.styles['BodyText']
             ))
-            elements.append(Spacer(1, 0.15 * inch))
+            elements.append(Spacer(1, SPACE_SMALL))
         
-        elements.append(PageBreak())
+        elements.append(PAGE_BREAK)
         return elements
     
     def _build_financial_section(self) -> List:
         """Build financial analysis section"""
-        recommended = self.data.get('recommendedScenario')
+        recommended = self.recommended
         if not recommended:
             return []
         
         elements = [
             Paragraph('Financial Analysis', self.styles['SectionHeader']),
-            Paragraph(f"Based on recommended scenario: {recommended['name']}", ParagraphStyle(
-                name='ScenarioNote',
-                fontSize=10,
-                textColor=COLORS['dark_gray'],
-                fontName='Helvetica-Oblique'
-            )),
-            Spacer(1, 0.2 * inch),
+            Paragraph(f"Based on recommended scenario: {recommended.name}", self.styles['ScenarioNote']),
+            Spacer(1, SPACE_MED),
         ]
         
         # Development Costs
         elements.append(Paragraph('Development Costs', self.styles['SubHeader']))
-        costs = recommended['costs']
+        costs = recommended.costs
         costs_data = [
             ['Cost Category', 'Amount'],
-            ['Hard Costs', format_currency(costs['hardCosts'])],
-            ['Soft Costs', format_currency(costs['softCosts'])],
-            ['Land Cost', format_currency(costs['landCost'])],
-            ['Financing Costs', format_currency(costs['financingCosts'])],
-            ['Contingency', format_currency(costs['contingency'])],
-            ['TOTAL', format_currency(costs['totalCost'])],
+            ['Hard Costs', format_currency(costs.hard_costs)],
+            ['Soft Costs', format_currency(costs.soft_costs)],
+            ['Land Cost', format_currency(costs.land_cost)],
+            ['Financing Costs', format_currency(costs.financing_costs)],
+            ['Contingency', format_currency(costs.contingency)],
+            ['TOTAL', format_currency(costs.total_cost)],
         ]
-        elements.append(self._create_table(costs_data, [3*inch, 2*inch], COLORS['secondary']))
-        elements.append(Spacer(1, 0.3 * inch))
+        elements.append(self._create_table(costs_data, FINANCIAL_COLS, SECONDARY))
+        elements.append(Spacer(1, SPACE_LG))
         
         # Investment Returns
         elements.append(Paragraph('Investment Returns', self.styles['SubHeader']))
-        proj = recommended['projections']
+        proj = recommended.projections
         returns_data = [
             ['Metric', 'Value'],
-            ['Total Asset Value', format_currency(proj['totalAssetValue'])],
-            ['Development Profit', format_currency(proj['developmentProfit'])],
-            ['Return on Investment (ROI)', format_percent(proj['roi'])],
-            ['Internal Rate of Return (IRR)', format_percent(proj['irr'])],
-            ['Equity Multiple', f"{proj['equityMultiple']:.2f}x"],
-            ['Cash-on-Cash Return', format_percent(proj['cashOnCash'])],
+            ['Total Asset Value', format_currency(proj.total_asset_value)],
+            ['Development Profit', format_currency(proj.development_profit)],
+            ['Return on Investment (ROI)', format_percent(proj.roi)],
+            ['Internal Rate of Return (IRR)', format_percent(proj.irr)],
+            ['Equity Multiple', f"{proj.equity_multiple:.2f}x"],
+            ['Cash-on-Cash Return', format_percent(proj.cash_on_cash)],
         ]
-        elements.append(self._create_table(returns_data, [3*inch, 2*inch], COLORS['accent']))
+        elements.append(self._create_table(returns_data, FINANCIAL_COLS, ACCENT))
         
         return elements
     
+    def _iter_sections(self) -> Iterator[List]:
+        """Yield each section's flowables in document order"""
+        yield self._build_title_page()
+        yield self._build_executive_summary()
+        yield self._build_property_overview()
+        yield self._build_scenarios_section()
+        yield self._build_financial_section()
+    
+    def _build_elements(self) -> List:
+        """
+        Build all report flowables.
+        
+        Built fresh for every generate call: doc.build() consumes the list and
+        marks the flowables it lays out (e.g. _postponed), so they can't be
+        reused for a second document.
+        """
+        elements = []
+        for section in self._iter_sections():
+            elements.extend(section)
+        return elements
+    
     def generate(self, output_path: str):
         """Generate the PDF report"""
-        doc = SimpleDocTemplate(
-            output_path,
-            pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch
-        )
+        doc = SimpleDocTemplate(output_path, **self._DOC_KW)
         
         # Build document
-        elements = []
-        elements.extend(self._build_title_page())
-        elements.extend(self._build_executive_summary())
-        elements.extend(self._build_property_overview())
-        elements.extend(self._build_scenarios_section())
-        elements.extend(self._build_financial_section())
-        
-        doc.build(elements)
+        doc.build(self._build_elements())
         print(f"✅ PDF generated: {output_path}")
     
     def generate_buffer(self) -> bytes:
         """Generate PDF and return as bytes"""
         buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch
-        )
+        doc = SimpleDocTemplate(buffer, **self._DOC_KW)
         
-        elements = []
-        elements.extend(self._build_title_page())
-        elements.extend(self._build_executive_summary())
-        elements.extend(self._build_property_overview())
-        elements.extend(self._build_scenarios_section())
-        elements.extend(self._build_financial_section())
-        
-        doc.build(elements)
+        doc.build(self._build_elements())
         return buffer.getvalue()
+    
+    def generate_stream(self, stream: BinaryIO):
+        """
+        Write the PDF straight to a binary stream (file, HTTP response, ...).
+        
+        Unlike generate_buffer(), the finished PDF isn't held in a BytesIO and
+        then copied out as bytes; layout itself costs the same either way.
+        """
+        doc = SimpleDocTemplate(stream, **self._DOC_KW)
+        
+        doc.build(self._build_elements())
+
+
+def load_report(input_file: str) -> Dict[str, Any]:
+    """Read a report JSON file"""
+    if orjson is not None:
+        with open(input_file, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(input_file, 'r') as f:
+        return json.load(f)
+
+
+def _generate_one(job: tuple) -> str:
+    """Worker entry point: (input_file, output_file, fast_tables) -> output_file"""
+    input_file, output_file, fast_tables = job
+    ZoneWisePDFReport(load_report(input_file), fast_tables=fast_tables).generate(output_file)
+    return output_file
 
 
 def main():
     """CLI entry point"""
-    if len(sys.argv) < 3:
-        print("Usage: python pdf_generator.py <report.json> <output.pdf>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description='ZoneWise PDF report generator')
+    parser.add_argument('input', nargs='?', help='report.json')
+    parser.add_argument('output', nargs='?', help='output.pdf')
+    parser.add_argument('--fast', action='store_true', help='draw tables directly on the canvas')
+    parser.add_argument('--batch', metavar='GLOB', help='render every report matching GLOB')
+    parser.add_argument('--out', metavar='DIR', help='output directory for --batch')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    args = parser.parse_args()
     
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    if args.batch:
+        if not args.out:
+            parser.error('--batch requires --out')
+        
+        os.makedirs(args.out, exist_ok=True)
+        jobs = [
+            (path, os.path.join(args.out, os.path.splitext(os.path.basename(path))[0] + '.pdf'), args.fast)
+            for path in sorted(glob.glob(args.batch))
+        ]
+        
+        # Reports are independent; module state (colors, styles, spacers) is read-only
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            done = sum(1 for _ in executor.map(_generate_one, jobs))
+        print(f"✅ {done} PDFs generated in {args.out}")
+        return
     
-    with open(input_file, 'r') as f:
-        report_data = json.load(f)
+    if not (args.input and args.output):
+        parser.print_usage()
+        sys.exit(1)
     
-    generator = ZoneWisePDFReport(report_data)
-    generator.generate(output_file)
+    _generate_one((args.input, args.output, args.fast))
 
 
 if __name__ == '__main__':